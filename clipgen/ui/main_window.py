@@ -1,13 +1,20 @@
 """Main application window."""
 
+import hashlib
+import json
+import re
+import sys
+import threading
 import time
+import webbrowser
+from functools import partial
+from itertools import islice
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QStackedWidget, QSizePolicy
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QStackedWidget, QSizePolicy, QDialog
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, QThreadPool, QRunnable, pyqtSignal
 from PyQt5.QtGui import QIcon
-from ctypes import windll, c_bool, c_int, byref
 import os
 
 from .styles import Styles
@@ -15,12 +22,83 @@ from .tray import TrayIconManager
 from .tabs import LogTab, SettingsTab, PromptsTab, HelpTab
 from .dialogs import InfoMessageBox, CustomMessageBox
 from .notifications import ToastNotification
+from .. import __version__
 from ..core.constants import resource_path
+from ..utils.autostart import set_autostart
+from ..utils.proxy import apply_proxy
+from ..utils.updates import UpdateChecker
+
+# Stylesheets are built once per process so Qt parses each unique sheet once
+_MAIN_QSS = Styles.main_window()
+_NAV_QSS = Styles.nav_button()
+_PIN_QSS = Styles.pin_button()
+_UPDATE_YES_QSS = Styles.dialog_button(Styles.SUCCESS)
+_UPDATE_NO_QSS = Styles.dialog_button(Styles.ERROR_HOVER)
+
+
+# Release notes Markdown: bold spans and headers for the dialog, emphasis
+# markers dropped for the log
+_RE_MD_BOLD = re.compile(r'\*\*([^*]+?)\*\*')
+_RE_MD_HEADER = re.compile(r'### (.*?)(<br>|$)')
+_MD_HEADER_REPL = r'<h3 style="color: #A3BFFA; margin: 10px 0 5px 0;">\1</h3>'
+_NOTES_STRIP_EMPHASIS = str.maketrans('', '', '*')
+
+# AI-generated instructions are reused for a week per language/hotkeys/model
+_INSTRUCTIONS_CACHE_TTL = 7 * 24 * 3600
+
+_APP_ICON = None  # Decoded once, on first window setup (needs a QApplication)
+
+
+def _get_app_icon():
+    """Return the cached application icon, or None if the .ico is missing."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        icon_path = resource_path("ClipGen.ico")
+        if os.path.exists(icon_path):
+            _APP_ICON = QIcon(icon_path)
+    return _APP_ICON
+
+
+def _batched(iterable, n: int):
+    """Yield successive tuples of up to n items (itertools.batched on 3.12+)."""
+    it = iter(iterable)
+    while batch := tuple(islice(it, n)):
+        yield batch
+
+
+class _TestRunnable(QRunnable):
+    """Runs an API key/model test callable on the shared test thread pool."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self._fn = fn
+
+    def run(self) -> None:
+        self._fn()
+
+
+def _instructions_cache_key(lang: str, hotkeys, provider: str, model: str) -> str:
+    """Return a short stable key for the inputs that shape the instructions."""
+    payload = json.dumps(
+        {"lang": lang, "hotkeys": hotkeys, "provider": provider, "model": model},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=8).hexdigest()
 
 
 class MainWindow(QMainWindow):
     """Main application window with tabs."""
 
+    # Config keys per provider: (api keys list, models list, active model)
+    _PROVIDER_KEYS = {
+        "gemini": ("api_keys", "gemini_models", "active_model"),
+        "openai": ("openai_api_keys", "openai_models", "openai_active_model"),
+    }
+
+    # Key/model tests wait on the network, not the CPU; enough threads to run
+    # a full list of rows at once without queueing
+    _TEST_THREADS = 16
+
     # Signals for cross-thread communication
     log_signal = pyqtSignal(str, str)  # message, color
     flash_tray_signal = pyqtSignal()
@@ -28,9 +106,12 @@ class MainWindow(QMainWindow):
     success_signal = pyqtSignal(str)  # duration
     error_signal = pyqtSignal()
     refresh_all_signal = pyqtSignal()
+    key_test_finished = pyqtSignal(str, int, bool)  # provider, index, success
+    model_test_finished = pyqtSignal(str, int, bool, float)  # provider, index, success, duration
     show_explanation_signal = pyqtSignal(str, str)  # explanation text, hotkey_color for learning mode
+    instructions_generated = pyqtSignal(str, str)  # cache key, text
 
-    # Update signals (called from background thread)
+    # Update check results (queued, so the dialog opens after the reply slot returns)
     update_found_signal = pyqtSignal(str, str, str)  # version, url, notes
     update_not_found_signal = pyqtSignal()
 
@@ -44,23 +125,53 @@ class MainWindow(QMainWindow):
         self.app = app
         self.config = app.config.config
         self.lang = app.i18n.lang
+        self._cache_lang()
 
         self.is_pinned = False
         self.working_timer = QTimer(self)
+        self.working_timer.setTimerType(Qt.CoarseTimer)
         self.start_time = 0
-
-        # Model test timers for live updates
+        self._last_tray_time = ""  # Last value drawn on the tray icon
+        self._dark_titlebar_hwnd = None  # Native window the dark titlebar was applied to
+
+        # Debounced config save for high-frequency edits (typing in inputs)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setTimerType(Qt.CoarseTimer)
+        self._save_timer.timeout.connect(self.app.config.save)
+
+        # Coalesced proxy re-application (enable, type and string edits)
+        self._proxy_apply_timer = QTimer(self)
+        self._proxy_apply_timer.setSingleShot(True)
+        self._proxy_apply_timer.setTimerType(Qt.CoarseTimer)
+        self._proxy_apply_timer.timeout.connect(lambda: apply_proxy(self.config))
+
+        # Bounded worker pool for API key/model tests
+        self._test_pool = QThreadPool(self)
+        self._test_pool.setMaxThreadCount(self._TEST_THREADS)
+
+        # Live elapsed-time display for running model tests (one shared tick)
         self.model_test_start_times = {}  # {(provider, index): start_time}
-        self.model_test_qtimers = {}  # {(provider, index): QTimer}
+        self._model_test_tick = QTimer(self)
+        self._model_test_tick.setTimerType(Qt.CoarseTimer)
+        self._model_test_tick.timeout.connect(self._update_model_test_timers)
+
+        # In-flight update check (QNetworkAccessManager reply owner)
+        self._update_checker = None
 
         self._setup_window()
         self._setup_ui()
         self._setup_tray()
         self._connect_signals()
 
+    def _cache_lang(self) -> None:
+        """Resolve frequently used language sections once per language load."""
+        self._lang_dialogs = self.lang.get("dialogs", {})
+        self._lang_tooltips = self.lang.get("tooltips", {})
+        self._lang_tabs = self.lang.get("tabs", {})
+
     def _setup_window(self) -> None:
         """Set up window properties."""
-        from .. import __version__
         app_title = self.lang.get("app_title", "ClipGen")
         self.setWindowTitle(f"{app_title} v{__version__}")
         self.setMinimumSize(300, 200)
@@ -70,15 +181,13 @@ class MainWindow(QMainWindow):
         self._apply_global_styles()
 
         # Apply dark theme to window
-        self.setStyleSheet(Styles.main_window())
+        self.setStyleSheet(_MAIN_QSS)
 
         # Set window icon
-        icon_path = resource_path("ClipGen.ico")
-        if os.path.exists(icon_path):
-            app_icon = QIcon(icon_path)
+        app_icon = _get_app_icon()
+        if app_icon is not None:
             self.setWindowIcon(app_icon)
-            from PyQt5.QtWidgets import QApplication as QtApp
-            QtApp.instance().setWindowIcon(app_icon)
+            QApplication.instance().setWindowIcon(app_icon)
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -123,82 +232,74 @@ class MainWindow(QMainWindow):
         self.action_layout.setContentsMargins(0, 0, 0, 0)
 
         self.action_buttons = {}
+        self._action_button_list = []  # All action buttons, for teardown
 
         # Timer for resize updates
-        self.button_resize_timer = QTimer()
+        self.button_resize_timer = QTimer(self)
         self.button_resize_timer.setSingleShot(True)
+        self.button_resize_timer.setTimerType(Qt.CoarseTimer)
         self.button_resize_timer.timeout.connect(self._refresh_action_buttons)
 
         layout.addWidget(self.action_widget, stretch=0)
 
     def _refresh_action_buttons(self) -> None:
         """Refresh action buttons from config."""
-        # Clear existing buttons
-        for widget in self.action_widget.findChildren(QPushButton):
-            widget.deleteLater()
-        self.action_buttons.clear()
-
-        # Clear existing layouts
-        while self.action_layout.count():
-            item = self.action_layout.takeAt(0)
-            if item.layout():
-                while item.layout().count():
-                    child = item.layout().takeAt(0)
-                    if child.widget():
-                        child.widget().deleteLater()
-
-        width = self.action_widget.width()
-        if width <= 0:
-            width = 500  # Default width on first run
-
-        buttons_per_row = max(1, width // 160)
-        hotkeys = self.config.get("hotkeys", [])
-        num_rows = (len(hotkeys) + buttons_per_row - 1) // buttons_per_row if hotkeys else 0
-        rows = [[] for _ in range(num_rows)]
-
-        tooltips = self.lang.get("tooltips", {})
-        tooltip_template = tooltips.get("main_action_button", "Press {combination}")
-
-        for i, hotkey in enumerate(hotkeys):
-            row_idx = i // buttons_per_row
-            color = hotkey.get("log_color", "#FFFFFF")
-            name = hotkey.get("name", "")
-            combination = hotkey.get("combination", "")
-
-            btn = QPushButton(name)
-            btn.setToolTip(tooltip_template.format(combination=combination))
-            btn.setFixedHeight(30)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    color: {color};
-                    background-color: #333333;
-                    border-radius: 10px;
-                    padding: 5px 10px;
-                }}
-                QPushButton:hover {{
-                    background-color: {color};
-                    color: #333333;
-                }}
-                QPushButton:pressed {{
-                    background-color: {color}80;
-                }}
-            """)
-
-            # Connect to trigger hotkey
-            btn.clicked.connect(
-                lambda checked, h=hotkey: self._trigger_hotkey(h)
-            )
+        # Rebuild with painting and geometry updates deferred to one pass at the end
+        self.action_widget.setUpdatesEnabled(False)
+        self.action_layout.setEnabled(False)
+        try:
+            # Clear existing buttons (tracked, no recursive child lookup)
+            for btn in self._action_button_list:
+                btn.setParent(None)
+                btn.deleteLater()
+            self._action_button_list.clear()
+            self.action_buttons.clear()
+
+            # Clear existing row layouts (buttons are already detached)
+            while self.action_layout.count():
+                row_layout = self.action_layout.takeAt(0).layout()
+                if row_layout is not None:
+                    row_layout.deleteLater()
+
+            width = self.action_widget.width()
+            if width <= 0:
+                width = 500  # Default width on first run
+
+            buttons_per_row = max(1, width // 160)
+            hotkeys = self.config.get("hotkeys", [])
+
+            format_tooltip = self._lang_tooltips.get("main_action_button", "Press {combination}").format
+
+            # Build one row at a time and attach buttons as they are created
+            for row in _batched(hotkeys, buttons_per_row):
+                row_layout = QHBoxLayout()
+                row_layout.setSpacing(8)
+
+                for hotkey in row:
+                    color = hotkey.get("log_color", "#FFFFFF")
+                    name = hotkey.get("name", "")
+                    combination = hotkey.get("combination", "")
+
+                    btn = QPushButton(name)
+                    btn.setToolTip(format_tooltip(combination=combination))
+                    btn.setFixedHeight(30)
+                    btn.setMinimumWidth(0)
+                    btn.setStyleSheet(Styles.action_button(color))
+
+                    # Connect to trigger hotkey
+                    btn.clicked.connect(
+                        lambda checked, h=hotkey: self._trigger_hotkey(h)
+                    )
 
-            rows[row_idx].append(btn)
-            self.action_buttons[combination] = btn
+                    row_layout.addWidget(btn, stretch=1)
+                    self.action_buttons[combination] = btn
+                    self._action_button_list.append(btn)
 
-        for row in rows:
-            row_layout = QHBoxLayout()
-            row_layout.setSpacing(8)
-            for btn in row:
-                btn.setMinimumWidth(0)
-                row_layout.addWidget(btn, stretch=1)
-            self.action_layout.addLayout(row_layout)
+                self.action_layout.addLayout(row_layout)
+        finally:
+            self.action_layout.setEnabled(True)
+            self.action_widget.setUpdatesEnabled(True)
+            self.action_widget.update()
 
     def _trigger_hotkey(self, hotkey: dict) -> None:
         """Trigger a hotkey action via queue."""
@@ -214,11 +315,11 @@ class MainWindow(QMainWindow):
         nav_layout.setContentsMargins(0, 0, 0, 0)
         nav_layout.setSpacing(5)
 
-        tabs = self.lang.get("tabs", {})
+        tabs = self._lang_tabs
 
         self.nav_buttons = []
-        nav_style = Styles.nav_button()  # Single stylesheet for all buttons
-        tooltips = self.lang.get("tooltips", {})
+        self._active_tab_index = 0
+        tooltips = self._lang_tooltips
 
         # Tab keys with their tooltip keys
         tab_configs = [
@@ -230,7 +331,7 @@ class MainWindow(QMainWindow):
 
         for i, (key, default, tooltip_key) in enumerate(tab_configs):
             btn = QPushButton(tabs.get(key, default))
-            btn.setStyleSheet(nav_style)
+            btn.setStyleSheet(_NAV_QSS)  # Single stylesheet for all buttons
             btn.setProperty("active", "true" if i == 0 else "false")
             btn.setToolTip(tooltips.get(tooltip_key, ""))
             btn.clicked.connect(lambda checked, idx=i: self._switch_tab(idx))
@@ -244,19 +345,9 @@ class MainWindow(QMainWindow):
         self.pin_button.setFixedSize(28, 28)
         self.pin_button.setObjectName("pinButton")
         self.pin_button.setToolTip(
-            self.lang.get("tooltips", {}).get("pin_window", "Pin/Unpin window on top")
+            self._lang_tooltips.get("pin_window", "Pin/Unpin window on top")
         )
-        self.pin_button.setStyleSheet("""
-            QPushButton#pinButton {
-                font-size: 16px;
-                background-color: transparent;
-                border: none;
-                color: #888888;
-            }
-            QPushButton#pinButton:hover {
-                color: #A3BFFA;
-            }
-        """)
+        self.pin_button.setStyleSheet(_PIN_QSS)
         self.pin_button.clicked.connect(self._toggle_pin)
         nav_layout.addWidget(self.pin_button)
 
@@ -264,13 +355,22 @@ class MainWindow(QMainWindow):
 
     def _switch_tab(self, index: int) -> None:
         """Switch to a tab."""
-        self.content_stack.setCurrentIndex(index)
+        previous = self._active_tab_index
+        self._active_tab_index = index
 
-        for i, btn in enumerate(self.nav_buttons):
-            btn.setProperty("active", "true" if i == index else "false")
-            # Force style refresh without changing stylesheet
-            btn.style().unpolish(btn)
-            btn.style().polish(btn)
+        self.setUpdatesEnabled(False)
+        try:
+            self.content_stack.setCurrentIndex(index)
+
+            # Only the previously and newly active buttons change state
+            for i in {previous, index}:
+                btn = self.nav_buttons[i]
+                btn.setProperty("active", "true" if i == index else "false")
+                # Force style refresh without changing stylesheet
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _toggle_pin(self) -> None:
         """Toggle always-on-top."""
@@ -318,31 +418,42 @@ class MainWindow(QMainWindow):
         self.log_tab.check_updates_button.clicked.connect(self._check_updates)
         self.log_tab.instructions_button.clicked.connect(self._show_instructions)
 
-        # Refresh signal
+        # Refresh signal (structural changes only)
         self.refresh_all_signal.connect(self._refresh_all)
 
+        # Test results (targeted row updates)
+        self.key_test_finished.connect(self._on_key_test_finished)
+        self.model_test_finished.connect(self._on_model_test_finished)
+
         # Update signals
-        self.update_found_signal.connect(self._on_update_found)
-        self.update_not_found_signal.connect(self._on_update_not_found)
+        self.update_found_signal.connect(self._on_update_found, Qt.QueuedConnection)
+        self.update_not_found_signal.connect(self._on_update_not_found, Qt.QueuedConnection)
 
         # Learning mode explanation signal
         self.show_explanation_signal.connect(self._show_explanation)
 
-        # Auto-check for updates after 3 seconds
-        QTimer.singleShot(3000, self._auto_check_updates)
+        # Generated instructions are cached on the GUI thread
+        self.instructions_generated.connect(self._cache_instructions)
+
+        # Auto-check for updates after 3 seconds (coarse: no need for precision)
+        QTimer.singleShot(3000, Qt.CoarseTimer, self._auto_check_updates)
 
     def _auto_check_updates(self) -> None:
         """Automatic update check on startup (silent, no log)."""
-        from ..utils.updates import UpdateChecker
-        from .. import __version__
-
-        checker = UpdateChecker(
+        self._start_update_checker(UpdateChecker(
             __version__,
             self.config.get("skipped_version", ""),
-            lambda v, u, n: self.update_found_signal.emit(v, u, n),
+            self.update_found_signal.emit,
             lambda: None,  # No callback for not found (silent)
-            is_manual=False
-        )
+            is_manual=False,
+            parent=self
+        ))
+
+    def _start_update_checker(self, checker) -> None:
+        """Keep a reference to the checker while its request is in flight."""
+        if self._update_checker is not None:
+            self._update_checker.deleteLater()
+        self._update_checker = checker
         checker.start()
 
     def _connect_settings_signals(self) -> None:
@@ -353,31 +464,31 @@ class MainWindow(QMainWindow):
         st.provider_changed.connect(self._on_provider_changed)
 
         # Gemini
-        st.gemini_key_added.connect(lambda: self._add_key("gemini"))
-        st.gemini_key_deleted.connect(lambda i: self._delete_key("gemini", i))
-        st.gemini_key_activated.connect(lambda i: self._activate_key("gemini", i))
-        st.gemini_key_updated.connect(lambda i, t: self._update_key("gemini", i, t))
-        st.gemini_key_test.connect(lambda i: self._test_key("gemini", i))
-
-        st.gemini_model_added.connect(lambda: self._add_model("gemini"))
-        st.gemini_model_deleted.connect(lambda i: self._delete_model("gemini", i))
-        st.gemini_model_activated.connect(lambda i: self._activate_model("gemini", i))
-        st.gemini_model_updated.connect(lambda i, t: self._update_model("gemini", i, t))
-        st.gemini_model_test.connect(lambda i: self._test_model("gemini", i))
+        st.gemini_key_added.connect(partial(self._add_key, "gemini"))
+        st.gemini_key_deleted.connect(partial(self._delete_key, "gemini"))
+        st.gemini_key_activated.connect(partial(self._activate_key, "gemini"))
+        st.gemini_key_updated.connect(partial(self._update_key, "gemini"))
+        st.gemini_key_test.connect(partial(self._test_key, "gemini"))
+
+        st.gemini_model_added.connect(partial(self._add_model, "gemini"))
+        st.gemini_model_deleted.connect(partial(self._delete_model, "gemini"))
+        st.gemini_model_activated.connect(partial(self._activate_model, "gemini"))
+        st.gemini_model_updated.connect(partial(self._update_model, "gemini"))
+        st.gemini_model_test.connect(partial(self._test_model, "gemini"))
 
         # OpenAI
         st.openai_base_url_changed.connect(self._on_base_url_changed)
-        st.openai_key_added.connect(lambda: self._add_key("openai"))
-        st.openai_key_deleted.connect(lambda i: self._delete_key("openai", i))
-        st.openai_key_activated.connect(lambda i: self._activate_key("openai", i))
-        st.openai_key_updated.connect(lambda i, t: self._update_key("openai", i, t))
-        st.openai_key_test.connect(lambda i: self._test_key("openai", i))
-
-        st.openai_model_added.connect(lambda: self._add_model("openai"))
-        st.openai_model_deleted.connect(lambda i: self._delete_model("openai", i))
-        st.openai_model_activated.connect(lambda i: self._activate_model("openai", i))
-        st.openai_model_updated.connect(lambda i, t: self._update_model("openai", i, t))
-        st.openai_model_test.connect(lambda i: self._test_model("openai", i))
+        st.openai_key_added.connect(partial(self._add_key, "openai"))
+        st.openai_key_deleted.connect(partial(self._delete_key, "openai"))
+        st.openai_key_activated.connect(partial(self._activate_key, "openai"))
+        st.openai_key_updated.connect(partial(self._update_key, "openai"))
+        st.openai_key_test.connect(partial(self._test_key, "openai"))
+
+        st.openai_model_added.connect(partial(self._add_model, "openai"))
+        st.openai_model_deleted.connect(partial(self._delete_model, "openai"))
+        st.openai_model_activated.connect(partial(self._activate_model, "openai"))
+        st.openai_model_updated.connect(partial(self._update_model, "openai"))
+        st.openai_model_test.connect(partial(self._test_model, "openai"))
 
         # Other
         st.autostart_toggled.connect(self._on_autostart_toggled)
@@ -395,33 +506,18 @@ class MainWindow(QMainWindow):
 
         pt.hotkey_added.connect(self._add_hotkey)
         pt.hotkey_deleted.connect(self._delete_hotkey)
-        pt.combination_changed.connect(
-            lambda i, c: self.app.hotkey_manager.update_combination(i, c)
-        )
-        pt.name_changed.connect(
-            lambda i, n: self.app.hotkey_manager.update_name(i, n)
-        )
-        pt.prompt_changed.connect(
-            lambda i, p: self.app.hotkey_manager.update_prompt(i, p)
-        )
-        pt.color_changed.connect(
-            lambda i, c: self.app.hotkey_manager.update_color(i, c)
-        )
-        pt.use_custom_model_changed.connect(
-            lambda i, v: self.app.hotkey_manager.update_use_custom_model(i, v)
-        )
-        pt.custom_provider_changed.connect(
-            lambda i, v: self.app.hotkey_manager.update_custom_provider(i, v)
-        )
-        pt.custom_model_changed.connect(
-            lambda i, v: self.app.hotkey_manager.update_custom_model(i, v)
-        )
-        pt.learning_mode_changed.connect(
-            lambda i, v: self.app.hotkey_manager.update_learning_mode(i, v)
-        )
-        pt.learning_prompt_changed.connect(
-            lambda i, v: self.app.hotkey_manager.update_learning_prompt(i, v)
-        )
+        pt.combination_changed.connect(self.app.hotkey_manager.update_combination)
+        pt.name_changed.connect(self.app.hotkey_manager.update_name)
+        pt.prompt_changed.connect(self.app.hotkey_manager.update_prompt)
+        pt.color_changed.connect(self.app.hotkey_manager.update_color)
+        pt.use_custom_model_changed.connect(self.app.hotkey_manager.update_use_custom_model)
+        pt.custom_provider_changed.connect(self.app.hotkey_manager.update_custom_provider)
+        pt.custom_model_changed.connect(self.app.hotkey_manager.update_custom_model)
+        pt.learning_mode_changed.connect(self.app.hotkey_manager.update_learning_mode)
+        pt.learning_prompt_changed.connect(self.app.hotkey_manager.update_learning_prompt)
+        # Log headers are matched by "combination: name"; rebuild them after the manager
+        pt.combination_changed.connect(lambda *_: self.log_tab.refresh_hotkeys())
+        pt.name_changed.connect(lambda *_: self.log_tab.refresh_hotkeys())
 
     # === Event Handlers ===
 
@@ -429,12 +525,22 @@ class MainWindow(QMainWindow):
         self.config["provider"] = "gemini" if index == 0 else "openai"
         self.app.config.save()
 
+    def _schedule_save(self, delay_ms: int = 300) -> None:
+        """Save config once the user pauses editing (restarts the debounce)."""
+        self._save_timer.start(delay_ms)
+
+    def _flush_save(self) -> None:
+        """Write a pending debounced save immediately."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.app.config.save()
+
     def _on_base_url_changed(self, text: str) -> None:
         self.config["openai_base_url"] = text.strip()
-        self.app.config.save()
+        self._schedule_save()
 
     def _add_key(self, provider: str) -> None:
-        key = "api_keys" if provider == "gemini" else "openai_api_keys"
+        key, _, _ = self._PROVIDER_KEYS[provider]
         self.config[key].append({
             "key": "", "name": "New Key", "usage_timestamps": [], "active": False
         })
@@ -444,7 +550,7 @@ class MainWindow(QMainWindow):
         self._refresh_all()
 
     def _delete_key(self, provider: str, index: int) -> None:
-        key = "api_keys" if provider == "gemini" else "openai_api_keys"
+        key, _, _ = self._PROVIDER_KEYS[provider]
         if 0 <= index < len(self.config[key]):
             key_data = self.config[key][index]
             key_value = key_data.get("key", "")
@@ -452,7 +558,7 @@ class MainWindow(QMainWindow):
 
             # Show confirmation if key has data
             if key_value or key_name:
-                dialogs_lang = self.lang.get("dialogs", {})
+                dialogs_lang = self._lang_dialogs
                 identifier = key_name if key_name else f"#{index + 1}"
                 msg = dialogs_lang.get("confirm_delete_api_key_message", "Delete API key '{key_identifier}'?")
                 msg = msg.replace("{key_identifier}", identifier)
@@ -475,7 +581,7 @@ class MainWindow(QMainWindow):
             self._refresh_all()
 
     def _activate_key(self, provider: str, index: int) -> None:
-        key = "api_keys" if provider == "gemini" else "openai_api_keys"
+        key, _, _ = self._PROVIDER_KEYS[provider]
         for i, k in enumerate(self.config[key]):
             k["active"] = (i == index)
         self.app.config.save()
@@ -484,41 +590,44 @@ class MainWindow(QMainWindow):
             self.app.gemini._configure_initial()
 
     def _update_key(self, provider: str, index: int, text: str) -> None:
-        key = "api_keys" if provider == "gemini" else "openai_api_keys"
+        key, _, _ = self._PROVIDER_KEYS[provider]
         if 0 <= index < len(self.config[key]):
             self.config[key][index]["key"] = text
-            self.app.config.save()
+            self._schedule_save()
 
     def _test_key(self, provider: str, index: int) -> None:
-        import threading
-
         # Update button to testing status immediately
         self.settings_tab.update_test_button_status(provider, "key", index, "testing")
 
         # Also update config status
-        key = "api_keys" if provider == "gemini" else "openai_api_keys"
+        key, _, _ = self._PROVIDER_KEYS[provider]
         if 0 <= index < len(self.config.get(key, [])):
             self.config[key][index]["test_status"] = "testing"
 
+        test_key = getattr(self.app.tester, f"test_{provider}_key")
+
         def run_test():
-            result = None
-            if provider == "gemini":
-                result = self.app.tester.test_gemini_key(index)
-            else:
-                result = self.app.tester.test_openai_key(index)
+            result = test_key(index)
 
             # Update config status based on result
+            success = bool(result and result.success)
             keys = self.config.get(key, [])
             if 0 <= index < len(keys):
-                keys[index]["test_status"] = "success" if result and result.success else "error"
+                keys[index]["test_status"] = "success" if success else "error"
 
-            self.app.config.save()
-            self.refresh_all_signal.emit()
+            # Saved in the slot (debounced save lives in the main thread)
+            self.key_test_finished.emit(provider, index, success)
+
+        self._test_pool.start(_TestRunnable(run_test))
 
-        threading.Thread(target=run_test, daemon=True).start()
+    def _on_key_test_finished(self, provider: str, index: int, success: bool) -> None:
+        """Update only the tested key's button."""
+        self._schedule_save()
+        status = "success" if success else "error"
+        self.settings_tab.update_test_button_status(provider, "key", index, status)
 
     def _add_model(self, provider: str) -> None:
-        key = "gemini_models" if provider == "gemini" else "openai_models"
+        _, key, _ = self._PROVIDER_KEYS[provider]
         self.config[key].append({
             "name": "new-model", "test_status": "not_tested", "test_duration": 0.0
         })
@@ -526,8 +635,7 @@ class MainWindow(QMainWindow):
         self._refresh_all()
 
     def _delete_model(self, provider: str, index: int) -> None:
-        key = "gemini_models" if provider == "gemini" else "openai_models"
-        active_key = "active_model" if provider == "gemini" else "openai_active_model"
+        _, key, active_key = self._PROVIDER_KEYS[provider]
 
         if 0 <= index < len(self.config[key]):
             model_data = self.config[key][index]
@@ -535,7 +643,7 @@ class MainWindow(QMainWindow):
 
             # Show confirmation if model has a name
             if model_name and model_name != "new-model":
-                dialogs_lang = self.lang.get("dialogs", {})
+                dialogs_lang = self._lang_dialogs
                 msg = dialogs_lang.get("confirm_delete_model_message", "Delete model '{model_name}'?")
                 msg = msg.replace("{model_name}", model_name)
 
@@ -557,27 +665,24 @@ class MainWindow(QMainWindow):
             self._refresh_all()
 
     def _activate_model(self, provider: str, index: int) -> None:
-        key = "gemini_models" if provider == "gemini" else "openai_models"
-        active_key = "active_model" if provider == "gemini" else "openai_active_model"
+        _, key, active_key = self._PROVIDER_KEYS[provider]
 
         if 0 <= index < len(self.config[key]):
             self.config[active_key] = self.config[key][index]["name"]
             self.app.config.save()
 
     def _update_model(self, provider: str, index: int, text: str) -> None:
-        key = "gemini_models" if provider == "gemini" else "openai_models"
-        active_key = "active_model" if provider == "gemini" else "openai_active_model"
+        _, key, active_key = self._PROVIDER_KEYS[provider]
 
         if 0 <= index < len(self.config[key]):
             old_name = self.config[key][index]["name"]
             self.config[key][index]["name"] = text
             if self.config.get(active_key) == old_name:
                 self.config[active_key] = text
-            self.app.config.save()
+            self._schedule_save()
 
     def _test_model(self, provider: str, index: int) -> None:
-        import threading
-        key = "gemini_models" if provider == "gemini" else "openai_models"
+        _, key, _ = self._PROVIDER_KEYS[provider]
 
         if 0 <= index < len(self.config[key]):
             self.config[key][index]["test_status"] = "testing"
@@ -585,53 +690,77 @@ class MainWindow(QMainWindow):
         # Update button to testing status
         self.settings_tab.update_test_button_status(provider, "model", index, "testing")
 
-        # Start live timer
-        timer_key = (provider, index)
-        start_time = time.time()
-        self.model_test_start_times[timer_key] = start_time
-
-        # Create and start QTimer for live updates
-        timer = QTimer(self)
-        timer.timeout.connect(lambda: self._update_model_test_timer_display(provider, index))
-        timer.start(100)  # Update every 100ms
-        self.model_test_qtimers[timer_key] = timer
+        # Start live timer (shows elapsed time once the test actually runs)
+        if not self._model_test_tick.isActive():
+            self._model_test_tick.start(100)  # Update every 100ms
 
         def run_test():
+            # Taken here, not at submit, so time spent queued in the pool
+            # is not counted as model latency
+            start_time = time.time()
+            self.model_test_start_times[(provider, index)] = start_time
+            result = None
             try:
                 if provider == "gemini":
-                    self.app.tester.test_gemini_model(index)
+                    result = self.app.tester.test_gemini_model(index)
                 else:
-                    self.app.tester.test_openai_model(index, start_time)
-                self.app.config.save()
+                    result = self.app.tester.test_openai_model(index, start_time)
             finally:
-                # Stop timer (must be done in main thread)
-                self.refresh_all_signal.emit()
-
-        threading.Thread(target=run_test, daemon=True).start()
-
-    def _update_model_test_timer_display(self, provider: str, index: int) -> None:
-        """Update the timer display during model testing."""
-        timer_key = (provider, index)
-        key = "gemini_models" if provider == "gemini" else "openai_models"
-
-        # Check if still testing
-        models = self.config.get(key, [])
-        if index >= len(models) or models[index].get("test_status") != "testing":
-            # Stop timer
-            if timer_key in self.model_test_qtimers:
-                self.model_test_qtimers[timer_key].stop()
-                del self.model_test_qtimers[timer_key]
-            if timer_key in self.model_test_start_times:
-                del self.model_test_start_times[timer_key]
-            return
+                success = bool(result and result.success)
+                duration = result.duration if success else 0.0
+
+                # Early validation failures in the tester leave the status untouched
+                models = self.config.get(key, [])
+                if 0 <= index < len(models):
+                    models[index]["test_status"] = "success" if success else "error"
+                    models[index]["test_duration"] = duration
+
+                # Timer stop and save happen in the slot (main thread)
+                self.model_test_finished.emit(provider, index, success, duration)
+
+        self._test_pool.start(_TestRunnable(run_test))
+
+    def _on_model_test_finished(self, provider: str, index: int, success: bool, duration: float) -> None:
+        """Stop the live timer and update only the tested model's row."""
+        self._schedule_save()
+        self._stop_model_test_timer(provider, index)
+        status = "success" if success else "error"
+        self.settings_tab.update_test_button_status(provider, "model", index, status)
+        self.settings_tab.update_model_time_label(
+            provider, index, f"{duration:.1f}s" if success else "err"
+        )
+
+    def _stop_model_test_timer(self, provider: str, index: int) -> None:
+        """Forget the live timer for a model test; stop the tick when none remain.
 
-        # Update time label
-        if timer_key in self.model_test_start_times:
-            elapsed = time.time() - self.model_test_start_times[timer_key]
-            self.settings_tab.update_model_time_label(provider, index, f"{elapsed:.1f}s")
+        Tests still waiting in the pool have no start time yet, so the tick
+        keeps running while the pool is busy.
+        """
+        self.model_test_start_times.pop((provider, index), None)
+        if not self.model_test_start_times and not self._test_pool.activeThreadCount():
+            self._model_test_tick.stop()
+
+    def _update_model_test_timers(self) -> None:
+        """Update the elapsed-time labels of all running model tests."""
+        now = time.time()
+        finished = []
+
+        # Iterate a snapshot; finished entries are removed afterwards
+        for (provider, index), start_time in list(self.model_test_start_times.items()):
+            _, key, _ = self._PROVIDER_KEYS[provider]
+            models = self.config.get(key, [])
+            if index >= len(models) or models[index].get("test_status") != "testing":
+                finished.append((provider, index))
+                continue
+            self.settings_tab.update_model_time_label(provider, index, f"{now - start_time:.1f}s")
+
+        for provider, index in finished:
+            self._stop_model_test_timer(provider, index)
+
+        if not self.model_test_start_times and not self._test_pool.activeThreadCount():
+            self._model_test_tick.stop()
 
     def _on_autostart_toggled(self, checked: bool) -> None:
-        from ..utils.autostart import set_autostart
         set_autostart(checked)
 
     def _on_auto_switch_toggled(self) -> None:
@@ -645,26 +774,26 @@ class MainWindow(QMainWindow):
         self._refresh_all()
 
     def _on_proxy_enabled(self, enabled: bool) -> None:
-        self.config["proxy_enabled"] = enabled
-        self.app.config.save()
-        from ..utils.proxy import apply_proxy
-        apply_proxy(self.config)
+        self._on_proxy_setting_changed("proxy_enabled", enabled)
 
     def _on_proxy_type(self, proxy_type: str) -> None:
-        self.config["proxy_type"] = proxy_type
-        self.app.config.save()
-        from ..utils.proxy import apply_proxy
-        apply_proxy(self.config)
+        self._on_proxy_setting_changed("proxy_type", proxy_type)
 
     def _on_proxy_string(self, proxy_string: str) -> None:
-        self.config["proxy_string"] = proxy_string
-        self.app.config.save()
+        self._on_proxy_setting_changed("proxy_string", proxy_string)
+
+    def _on_proxy_setting_changed(self, config_key: str, value) -> None:
+        """Store a proxy setting; save and re-apply the proxy once edits settle."""
+        self.config[config_key] = value
+        self._schedule_save()
+        self._proxy_apply_timer.start(150)
 
     def _on_language_changed(self, language: str) -> None:
         self.config["language"] = language
         self.app.config.save()
         self.app.i18n.load()
         self.lang = self.app.i18n.lang
+        self._cache_lang()
 
         # Update processor language for learning mode prompts
         self.app.processor.lang = self.app.i18n.lang
@@ -674,7 +803,6 @@ class MainWindow(QMainWindow):
 
     def _update_all_language(self) -> None:
         """Update all UI elements with the current language."""
-        from .. import __version__
         lang = self.lang
 
         # Update window title with version
@@ -682,7 +810,7 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(f"{app_title} v{__version__}")
 
         # Update navigation buttons
-        tabs = lang.get("tabs", {})
+        tabs = self._lang_tabs
         tab_keys = [("logs", "Logs"), ("settings", "Settings"), ("prompts", "Prompts"), ("help", "Help")]
         for i, (key, default) in enumerate(tab_keys):
             if i < len(self.nav_buttons):
@@ -699,11 +827,17 @@ class MainWindow(QMainWindow):
 
         # Update pin button tooltip
         self.pin_button.setToolTip(
-            lang.get("tooltips", {}).get("pin_window", "Pin/Unpin window on top")
+            self._lang_tooltips.get("pin_window", "Pin/Unpin window on top")
         )
 
-        # Update action buttons (they use hotkey names from config, not lang)
-        self._refresh_action_buttons()
+        # Action buttons use hotkey names from config; only the tooltip is localized
+        hotkeys = self.config.get("hotkeys", [])
+        if len(hotkeys) != len(self._action_button_list):
+            self._refresh_action_buttons()
+            return
+        format_tooltip = self._lang_tooltips.get("main_action_button", "Press {combination}").format
+        for btn, hotkey in zip(self._action_button_list, hotkeys):
+            btn.setToolTip(format_tooltip(combination=hotkey.get("combination", "")))
 
     def _on_scale_changed(self, delta: float) -> None:
         current = self.config.get("ui_scale", 1.0)
@@ -714,8 +848,8 @@ class MainWindow(QMainWindow):
             self.config["ui_scale"] = new_scale
             self.app.config.save()
             self.settings_tab.scale_label.setText(f"{int(new_scale * 100)}%")
-            title = self.lang.get("dialogs", {}).get("restart_required_title", "Restart Required")
-            message = self.lang.get("dialogs", {}).get(
+            title = self._lang_dialogs.get("restart_required_title", "Restart Required")
+            message = self._lang_dialogs.get(
                 "restart_required_message",
                 "Scale changed to {scale}%.<br>Please restart the app to apply changes."
             ).format(scale=int(new_scale * 100))
@@ -725,6 +859,7 @@ class MainWindow(QMainWindow):
     def _add_hotkey(self) -> None:
         self.app.hotkey_manager.add()
         self.prompts_tab.refresh()
+        self.log_tab.refresh_hotkeys()
         self._refresh_action_buttons()
 
     def _delete_hotkey(self, index: int) -> None:
@@ -738,7 +873,7 @@ class MainWindow(QMainWindow):
 
             # Show confirmation if hotkey has custom data
             if action_name and action_name != default_action_name or prompt and prompt != default_prompt:
-                dialogs_lang = self.lang.get("dialogs", {})
+                dialogs_lang = self._lang_dialogs
                 display_name = action_name if action_name else f"#{index + 1}"
                 msg = dialogs_lang.get("confirm_delete_message", "Delete action '{action_name}'?")
                 msg = msg.replace("{action_name}", display_name)
@@ -755,15 +890,13 @@ class MainWindow(QMainWindow):
 
         self.app.hotkey_manager.delete(index)
         self.prompts_tab.refresh()
+        self.log_tab.refresh_hotkeys()
         self._refresh_action_buttons()
 
     def _stop_current_task(self) -> None:
         self.app.processor.cancel_current()
 
     def _check_updates(self) -> None:
-        from ..utils.updates import UpdateChecker
-        from .. import __version__
-
         # Log that we're checking (with line break before)
         self.log_tab.append_log("", "#888888")  # Empty line for spacing
         self.log_tab.append_log(
@@ -771,22 +904,19 @@ class MainWindow(QMainWindow):
             "#A3BFFA"
         )
 
-        # Use lambdas that emit signals (thread-safe)
-        checker = UpdateChecker(
+        # Results go through queued signals: the reply slot returns (and the
+        # reply is released) before the modal update dialog opens
+        self._start_update_checker(UpdateChecker(
             __version__,
             self.config.get("skipped_version", ""),
-            lambda v, u, n: self.update_found_signal.emit(v, u, n),
-            lambda: self.update_not_found_signal.emit(),
-            is_manual=True
-        )
-        checker.start()
+            self.update_found_signal.emit,
+            self.update_not_found_signal.emit,
+            is_manual=True,
+            parent=self
+        ))
 
     def _on_update_found(self, version: str, url: str, notes: str) -> None:
         """Show update dialog when new version found."""
-        import re
-        import webbrowser
-        from PyQt5.QtWidgets import QDialog
-
         self.tray.set_update()
 
         # Log update info
@@ -798,11 +928,18 @@ class MainWindow(QMainWindow):
 
         # Log release notes if available
         if notes:
-            # Clean up markdown for plain text log
-            clean_notes = notes.replace("### ", "").replace("**", "").replace("* ", "• ")
-            for line in clean_notes.strip().split("\n"):
-                if line.strip():
-                    self.log_tab.append_log(f"  {line.strip()}", "#AAAAAA")
+            # Clean up markdown for plain text log (logged as one block)
+            note_lines = []
+            for line in notes.strip().split("\n"):
+                line = line.strip()
+                if line.startswith("### "):
+                    line = line[4:]
+                elif line.startswith("* "):
+                    line = "• " + line[2:]
+                line = line.translate(_NOTES_STRIP_EMPHASIS).strip()
+                if line:
+                    note_lines.append((f"  {line}", "#AAAAAA"))
+            self.log_tab.append_log_batch(note_lines)
 
         # Build dialog content
         title = updates_lang.get("title", "ClipGen Update Available")
@@ -815,14 +952,9 @@ class MainWindow(QMainWindow):
         if notes:
             formatted_notes = notes.replace("\r\n", "<br>").replace("\n", "<br>")
             # Bold text
-            while "**" in formatted_notes:
-                formatted_notes = formatted_notes.replace("**", "<b>", 1).replace("**", "</b>", 1)
+            formatted_notes = _RE_MD_BOLD.sub(r'<b>\1</b>', formatted_notes)
             # Headers
-            formatted_notes = re.sub(
-                r'### (.*?)(<br>|$)',
-                r'<h3 style="color: #A3BFFA; margin: 10px 0 5px 0;">\1</h3>',
-                formatted_notes
-            )
+            formatted_notes = _RE_MD_HEADER.sub(_MD_HEADER_REPL, formatted_notes)
             # Bullet points
             formatted_notes = formatted_notes.replace("* ", "&nbsp;&nbsp;• ")
             notes_html = f"<hr style='border: 1px solid #444; margin: 10px 0;'><div style='font-family: sans-serif;'>{formatted_notes}</div>"
@@ -839,30 +971,8 @@ class MainWindow(QMainWindow):
         )
 
         # Override button styles: Download = green, Skip = red
-        dialog.yes_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 0;
-            }
-            QPushButton:hover {
-                background-color: #28A745;
-            }
-        """)
-        dialog.no_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 0;
-            }
-            QPushButton:hover {
-                background-color: #C82333;
-            }
-        """)
+        dialog.yes_button.setStyleSheet(_UPDATE_YES_QSS)
+        dialog.no_button.setStyleSheet(_UPDATE_NO_QSS)
 
         result = dialog.exec_()
 
@@ -884,85 +994,102 @@ class MainWindow(QMainWindow):
 
     def _show_instructions(self) -> None:
         """Generate and display usage instructions using AI."""
-        import threading
-
         instruction_lang = self.lang.get("instruction", {})
         fallback_lang = self.lang.get("instruction_fallback", {})
+        title = instruction_lang.get("title", "ClipGen Usage Instructions")
 
         # Check if we have basic_steps (structured instructions)
         basic_steps = instruction_lang.get("basic_steps", [])
 
         if basic_steps:
             # Use structured instructions from language file
-            self.log_signal.emit("\n" + "─" * 40, "#888888")
-            self.log_signal.emit(
-                instruction_lang.get("title", "ClipGen Usage Instructions"),
-                "#A3BFFA"
-            )
+            self._log_instructions(title, basic_steps)
+            return
 
-            for step in basic_steps:
-                self.log_signal.emit(step, "#FFFFFF")
+        # Build prompt with hotkeys info
+        base_prompt = instruction_lang.get(
+            "prompt",
+            "Write a brief guide on how to use the ClipGen application."
+        )
 
-            self.log_signal.emit("─" * 40 + "\n", "#888888")
-            return
+        # Add current language context
+        current_lang = self.config.get("language", "en")
+        if current_lang == "ru":
+            lang_instruction = "IMPORTANT: Write the response in Russian language."
+        else:
+            lang_instruction = f"IMPORTANT: Write the response in the language with code '{current_lang}'."
 
-        # Otherwise, generate instructions using AI
-        def generate():
-            try:
-                # Build prompt with hotkeys info
-                base_prompt = instruction_lang.get(
-                    "prompt",
-                    "Write a brief guide on how to use the ClipGen application."
-                )
+        # Add hotkeys information
+        hotkeys = [
+            (hk.get('combination', ''), hk.get('name', ''))
+            for hk in self.config.get("hotkeys", [])
+        ]
+        hotkeys_info = "\n\nAvailable hotkeys:\n" + "".join(
+            f"- {combination}: {name}\n" for combination, name in hotkeys
+        )
 
-                # Add current language context
-                current_lang = self.config.get("language", "en")
-                if current_lang == "ru":
-                    lang_instruction = "IMPORTANT: Write the response in Russian language."
-                else:
-                    lang_instruction = f"IMPORTANT: Write the response in the language with code '{current_lang}'."
+        full_prompt = f"{base_prompt}\n{hotkeys_info}\n{lang_instruction}"
 
-                # Add hotkeys information
-                hotkeys_info = "\n\nAvailable hotkeys:\n"
-                for hk in self.config.get("hotkeys", []):
-                    hotkeys_info += f"- {hk.get('combination', '')}: {hk.get('name', '')}\n"
+        # Reuse a recent result without leaving the GUI thread
+        provider = self.config.get("provider", "gemini")
+        _, _, model_key = self._PROVIDER_KEYS.get(provider, self._PROVIDER_KEYS["openai"])
+        cache_key = _instructions_cache_key(
+            current_lang, hotkeys, provider, self.config.get(model_key, "")
+        )
+        cached = self.config.get("instructions_cache", {}).get(cache_key)
 
-                full_prompt = f"{base_prompt}\n{hotkeys_info}\n{lang_instruction}"
+        if cached and time.time() - cached.get("ts", 0) < _INSTRUCTIONS_CACHE_TTL:
+            self._log_instructions(title, [cached.get("text", "")])
+            return
 
+        # Otherwise, generate instructions using AI
+        def generate():
+            try:
                 # Generate using active provider
-                provider = self.config.get("provider", "gemini")
-
                 if provider == "gemini":
                     result = self._generate_instructions_gemini(full_prompt)
                 else:
                     result = self._generate_instructions_openai(full_prompt)
 
                 if result:
-                    # Format and display
-                    self.log_signal.emit("\n" + "─" * 40, "#888888")
-                    self.log_signal.emit(
-                        instruction_lang.get("title", "ClipGen Usage Instructions"),
-                        "#A3BFFA"
-                    )
-                    self.log_signal.emit(result, "#FFFFFF")
-                    self.log_signal.emit("─" * 40 + "\n", "#888888")
+                    self.instructions_generated.emit(cache_key, result)
+                    self._log_instructions(title, [result])
                 else:
                     raise Exception("Empty response")
 
             except Exception as e:
                 # Use fallback instructions
-                self.log_signal.emit("\n" + "─" * 40, "#888888")
-                self.log_signal.emit(
+                self._log_instructions(
                     fallback_lang.get("title", "How to use ClipGen:"),
-                    "#A3BFFA"
+                    [
+                        fallback_lang.get("step1", "1. Copy text to clipboard"),
+                        fallback_lang.get("step2", "2. Press hotkey"),
+                        fallback_lang.get("step3", "3. Result replaces selection"),
+                    ]
                 )
-                self.log_signal.emit(fallback_lang.get("step1", "1. Copy text to clipboard"), "#FFFFFF")
-                self.log_signal.emit(fallback_lang.get("step2", "2. Press hotkey"), "#FFFFFF")
-                self.log_signal.emit(fallback_lang.get("step3", "3. Result replaces selection"), "#FFFFFF")
-                self.log_signal.emit("─" * 40 + "\n", "#888888")
 
         threading.Thread(target=generate, daemon=True).start()
 
+    def _log_instructions(self, title: str, lines) -> None:
+        """Log an instructions block: separator, title, body in one emit, separator."""
+        self.log_signal.emit("\n" + "─" * 40, "#888888")
+        self.log_signal.emit(title, "#A3BFFA")
+        # append_log indents the first line only; keep every line indented
+        self.log_signal.emit("\n    ".join(lines), "#FFFFFF")
+        self.log_signal.emit("─" * 40 + "\n", "#888888")
+
+    def _cache_instructions(self, cache_key: str, text: str) -> None:
+        """Store generated instructions and drop expired entries."""
+        now = time.time()
+        cache = {
+            key: entry
+            for key, entry in self.config.get("instructions_cache", {}).items()
+            if now - entry.get("ts", 0) < _INSTRUCTIONS_CACHE_TTL
+        }
+        cache[cache_key] = {"text": text, "ts": now}
+        self.config["instructions_cache"] = cache
+        self._schedule_save()
+
     def _generate_instructions_gemini(self, prompt: str) -> str:
         """Generate instructions using Gemini API."""
         import google.generativeai as genai
@@ -1033,6 +1160,7 @@ class MainWindow(QMainWindow):
         """Refresh all UI elements."""
         self.settings_tab.refresh_all()
         self._refresh_action_buttons()
+        self.log_tab.refresh_hotkeys()
 
     def _toggle_visibility(self) -> None:
         """Toggle window visibility."""
@@ -1044,11 +1172,14 @@ class MainWindow(QMainWindow):
 
     def _quit_application(self) -> None:
         """Quit the application."""
+        self._save_timer.stop()  # shutdown() saves the config itself
+        self._test_pool.clear()  # Drop queued tests; running ones finish on their timeouts
         self.app.shutdown()
 
     def _start_working(self) -> None:
         """Start working animation."""
         self.start_time = time.time()
+        self._last_tray_time = ""
         self._update_working_time()  # Show initial 0.0
         self.working_timer.start(100)  # Update every 100ms
 
@@ -1056,21 +1187,26 @@ class MainWindow(QMainWindow):
         """Update working time display."""
         if self.start_time > 0:
             elapsed = time.time() - self.start_time
-            self.tray.set_working(f"{elapsed:.1f}")  # Format: 0.1, 0.2, 0.3...
+            time_str = f"{elapsed:.1f}"  # Format: 0.1, 0.2, 0.3...
+            # Coarse timer ticks can land twice in the same tenth; skip the redraw
+            if time_str == self._last_tray_time:
+                return
+            self._last_tray_time = time_str
+            self.tray.set_working(time_str)
 
     def _on_success(self, duration: str) -> None:
         """Handle successful operation."""
         self.working_timer.stop()
         self.start_time = 0
         self.tray.set_success(duration)
-        QTimer.singleShot(3000, self.tray.set_default)
+        QTimer.singleShot(3000, Qt.CoarseTimer, self.tray.set_default)
 
     def _on_error(self) -> None:
         """Handle error."""
         self.working_timer.stop()
         self.start_time = 0
         self.tray.set_error()
-        QTimer.singleShot(3000, self.tray.set_default)
+        QTimer.singleShot(3000, Qt.CoarseTimer, self.tray.set_default)
 
     def _show_explanation(self, text: str, hotkey_color: str = "#FFFFFF") -> None:
         """Show explanation in toast notification and logs (learning mode)."""
@@ -1085,22 +1221,33 @@ class MainWindow(QMainWindow):
         super().showEvent(event)
         self._set_dark_titlebar()
         # Refresh buttons after window is visible (has correct width)
-        QTimer.singleShot(100, self._refresh_action_buttons)
+        QTimer.singleShot(100, Qt.CoarseTimer, self._refresh_action_buttons)
 
     def _set_dark_titlebar(self) -> None:
         """Set Windows 11 dark titlebar."""
+        if sys.platform != "win32":
+            return
+        from ctypes import windll, c_bool, byref
+
         try:
             hwnd = int(self.winId())
+            # Pinning recreates the native window, so remember the handle,
+            # not just that it succeeded once
+            if hwnd == self._dark_titlebar_hwnd:
+                return
             DWMWA_USE_IMMERSIVE_DARK_MODE = 20
-            windll.dwmapi.DwmSetWindowAttribute(
+            result = windll.dwmapi.DwmSetWindowAttribute(
                 hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
                 byref(c_bool(True)), 4
             )
+            if result == 0:  # S_OK
+                self._dark_titlebar_hwnd = hwnd
         except Exception:
             pass
 
     def closeEvent(self, event) -> None:
         """Hide to tray on close."""
+        self._flush_save()
         event.ignore()
         self.hide()
 
@@ -1112,5 +1259,4 @@ class MainWindow(QMainWindow):
 
     def _apply_global_styles(self) -> None:
         """Apply global styles to the application."""
-        from PyQt5.QtWidgets import QApplication
         QApplication.instance().setStyleSheet(Styles.global_app_style())
@@ -1,15 +1,177 @@
 """Toast notifications for ClipGen."""
 
 import re
+from functools import lru_cache
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QTextBrowser, QScrollArea,
-    QDesktopWidget, QGraphicsDropShadowEffect
+    QGraphicsDropShadowEffect
 )
 from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QGuiApplication
 
 from .styles import Styles
 
+# Markdown -> HTML patterns, compiled once at import.
+# Arrow alternatives: ASCII (->, =>) and Unicode (→, –>, —>).
+_ARROW = r'\s*(?:->|→|=>|–>|—>)\s*'
+
+_WORD = r'[а-яА-ЯёЁa-zA-Z]{1,40}'
+
+# Longer texts skip arrow highlighting (defense against pathological input)
+_ARROW_MAX_LEN = 20_000
+
+
+def _arrow_side(n: int) -> str:
+    """One side of an error -> correct pair: **bold**, "double", 'single' or bare words.
+
+    Use [^*]+ instead of .+? to avoid issues with greedy matching. Bare words
+    match single words or short phrases (e.g., "что бы -> чтобы"); word length
+    and count are bounded and phrases never span lines, so long runs of words
+    without an arrow cannot trigger runaway backtracking.
+    """
+    return (
+        rf'(?:\*\*(?P<b{n}>[^*]+)\*\*'
+        rf'|"(?P<d{n}>[^"]+)"'
+        rf"|'(?P<s{n}>[^']+)'"
+        rf'|(?<![*"\'\w])(?P<w{n}>{_WORD}(?:[ \t]+{_WORD}){{0,7}})(?![*"\'\w]))'
+    )
+
+
+# All error -> correct forms in a single pass
+_RE_ARROW = re.compile(_arrow_side(1) + _ARROW + _arrow_side(2))
+_RE_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_RE_ITALIC = re.compile(r'(?<!\*)\*([^*]+?)\*(?!\*)')
+_RE_CODE = re.compile(r'`(.+?)`')
+_RE_H3 = re.compile(r'^### (.+)$', re.MULTILINE)
+_RE_H2 = re.compile(r'^## (.+)$', re.MULTILINE)
+_RE_BULLET = re.compile(r'^[\-\*] (.+)$', re.MULTILINE)
+_RE_NUMBERED = re.compile(r'^(\d+)\. (.+)$', re.MULTILINE)
+_RE_NEWLINE = re.compile(r'(?<!>)\n(?!<)')
+
+# Replacement templates: bare tags, styled once by the document stylesheet
+_ARROW_HTML = '<b class="error">{}</b> → <b class="correct">{}</b>'
+_CODE_REPL = r'<code>\1</code>'
+_H3_REPL = r'<h4>\1</h4>'
+_H2_REPL = r'<h3>\1</h3>'
+_BULLET_REPL = r'<div class="item"><span class="marker">•</span> \1</div>'
+_NUMBERED_REPL = r'<div class="item"><span class="marker">\1.</span> \2</div>'
+# The wrapper keeps its inline style: Qt inherits a stylesheet line-height
+# into nested blocks (list items, headers), an inline one it does not
+_HTML_WRAPPER = (
+    f'<div style="font-family: Segoe UI, sans-serif; '
+    f'color: {Styles.TEXT}; line-height: 1.5;">{{}}</div>'
+)
+
+# Default stylesheet of the toast document (applied by Qt on every setHtml)
+_DOCUMENT_CSS = f"""
+    b.error {{ color: {Styles.DELETE_RED}; }}
+    b.correct {{ color: {Styles.SUCCESS}; }}
+    code {{ background-color: #333; padding: 2px 5px; border-radius: 3px; font-family: Consolas, monospace; }}
+    h4 {{ color: {Styles.ACCENT}; margin: 8px 0 4px 0; font-size: 13px; }}
+    h3 {{ color: {Styles.ACCENT}; margin: 10px 0 5px 0; font-size: 14px; }}
+    div.item {{ margin-left: 10px; margin-bottom: 3px; }}
+    span.marker {{ color: #888; }}
+"""
+
+# Toast stylesheets, formatted once at import
+_CONTAINER_QSS = f"""
+    QWidget {{
+        background-color: {Styles.CARD_BG};
+        border-radius: 12px;
+        border: 1px solid {Styles.BORDER};
+    }}
+"""
+_SCROLL_QSS = f"""
+    QScrollArea {{
+        background-color: transparent;
+        border: none;
+    }}
+    QScrollBar:vertical {{
+        background-color: transparent;
+        width: 8px;
+        margin: 0;
+    }}
+    QScrollBar::handle:vertical {{
+        background-color: {Styles.BORDER};
+        border-radius: 4px;
+        min-height: 20px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background-color: {Styles.BUTTON_HOVER};
+    }}
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        height: 0;
+    }}
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
+        background-color: transparent;
+    }}
+"""
+_BROWSER_QSS = f"""
+    QTextBrowser {{
+        background-color: transparent;
+        color: {Styles.TEXT};
+        border: none;
+        font-size: 13px;
+        font-family: 'Segoe UI', sans-serif;
+    }}
+"""
+
+# Distinct toast texts whose HTML and document height are cached
+_RENDER_CACHE_SIZE = 64
+
+# Any of these can start a Markdown construct; text without them (and not
+# opening with a list marker) is wrapped as-is. Every arrow ends in '>' or is '→'.
+_MARKDOWN_CHARS = frozenset('*`#>→\n')
+_LIST_START_CHARS = '-0123456789'
+
+
+def _arrow_repl(match) -> str:
+    """Format whichever alternative matched on each side of the arrow."""
+    error = match["b1"] or match["d1"] or match["s1"] or match["w1"]
+    correct = match["b2"] or match["d2"] or match["s2"] or match["w2"]
+    return _ARROW_HTML.format(error, correct)
+
+
+@lru_cache(maxsize=_RENDER_CACHE_SIZE)
+def _render_markdown(text: str) -> str:
+    """Convert basic Markdown to HTML (cached: learning-mode hints repeat).
+
+    QTextDocument.setMarkdown was measured as a replacement: it keeps the
+    error -> correct colors but drops header colors, code styling and the
+    custom list markers, and saves under 10% of a show (the regexes are a
+    fraction of setHtml layout and are cached here anyway).
+    """
+    html = text
+
+    # Error -> Correct pattern (red -> green): **error** -> **correct**,
+    # "error" -> "correct", 'error' -> 'correct' or error → correct
+    if len(html) <= _ARROW_MAX_LEN:
+        html = _RE_ARROW.sub(_arrow_repl, html)
+
+    # Regular Bold: **text** (for remaining bold that wasn't error->correct)
+    html = _RE_BOLD.sub(r'<b>\1</b>', html)
+
+    # Italic: *text*
+    html = _RE_ITALIC.sub(r'<i>\1</i>', html)
+
+    # Code: `text`
+    html = _RE_CODE.sub(_CODE_REPL, html)
+
+    # Headers: ### text
+    html = _RE_H3.sub(_H3_REPL, html)
+    html = _RE_H2.sub(_H2_REPL, html)
+
+    # Bullet points: - text or * text (at start of line)
+    html = _RE_BULLET.sub(_BULLET_REPL, html)
+
+    # Numbered lists: 1. text
+    html = _RE_NUMBERED.sub(_NUMBERED_REPL, html)
+
+    # Line breaks (but not after block elements)
+    html = _RE_NEWLINE.sub('<br>', html)
+
+    return _HTML_WRAPPER.format(html)
+
 
 class ToastNotification(QWidget):
     """Toast notification widget for displaying explanations.
@@ -33,6 +195,13 @@ class ToastNotification(QWidget):
         self._is_hovered = False
         self._should_close = False
         self._animation = None
+        self._height_cache = {}  # {markdown_text: document height}
+
+        # Primary screen work area, refreshed only when the screen changes
+        self._screen = None
+        self._screen_geom = None
+        self._track_screen(QGuiApplication.primaryScreen())
+        QGuiApplication.instance().primaryScreenChanged.connect(self._track_screen)
 
         self._setup_ui()
         self._setup_timers()
@@ -45,13 +214,7 @@ class ToastNotification(QWidget):
 
         # Container with background
         self.container = QWidget(self)
-        self.container.setStyleSheet(f"""
-            QWidget {{
-                background-color: {Styles.CARD_BG};
-                border-radius: 12px;
-                border: 1px solid {Styles.BORDER};
-            }}
-        """)
+        self.container.setStyleSheet(_CONTAINER_QSS)
         main_layout.addWidget(self.container)
 
         # Container layout
@@ -62,55 +225,27 @@ class ToastNotification(QWidget):
         # Scroll area for content
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: transparent;
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background-color: transparent;
-                width: 8px;
-                margin: 0;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {Styles.BORDER};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {Styles.BUTTON_HOVER};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-                height: 0;
-            }}
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-                background-color: transparent;
-            }}
-        """)
+        self.scroll_area.setStyleSheet(_SCROLL_QSS)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         # Text browser for Markdown content
         self.text_browser = QTextBrowser()
         self.text_browser.setOpenExternalLinks(True)
-        self.text_browser.setStyleSheet(f"""
-            QTextBrowser {{
-                background-color: transparent;
-                color: {Styles.TEXT};
-                border: none;
-                font-size: 13px;
-                font-family: 'Segoe UI', sans-serif;
-            }}
-        """)
+        # Read-only display: no undo history, no context menu
+        self.text_browser.setUndoRedoEnabled(False)
+        self.text_browser.setContextMenuPolicy(Qt.NoContextMenu)
+        self.text_browser.document().setDefaultStyleSheet(_DOCUMENT_CSS)
+        self.text_browser.setStyleSheet(_BROWSER_QSS)
 
         self.scroll_area.setWidget(self.text_browser)
         container_layout.addWidget(self.scroll_area)
 
         # Shadow effect
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(25)
-        shadow.setColor(QColor(0, 0, 0, 120))
-        shadow.setOffset(0, 5)
-        self.container.setGraphicsEffect(shadow)
+        self._shadow = QGraphicsDropShadowEffect(self)
+        self._shadow.setBlurRadius(25)
+        self._shadow.setColor(QColor(0, 0, 0, 120))
+        self._shadow.setOffset(0, 5)
+        self.container.setGraphicsEffect(self._shadow)
 
         # Fixed width
         self.setFixedWidth(420)
@@ -137,11 +272,18 @@ class ToastNotification(QWidget):
 
         # Convert Markdown to HTML
         html = self._markdown_to_html(markdown_text)
+        self.text_browser.setUpdatesEnabled(False)
         self.text_browser.setHtml(html)
 
-        # Calculate content height dynamically
-        self.text_browser.document().adjustSize()
-        doc_height = self.text_browser.document().size().height()
+        # Calculate content height dynamically (reused for repeated texts)
+        doc_height = self._height_cache.get(markdown_text)
+        if doc_height is None:
+            self.text_browser.document().adjustSize()
+            doc_height = self.text_browser.document().size().height()
+            if len(self._height_cache) >= _RENDER_CACHE_SIZE:
+                self._height_cache.clear()
+            self._height_cache[markdown_text] = doc_height
+        self.text_browser.setUpdatesEnabled(True)
 
         # Content area: min 30px, max 280px
         content_height = min(280, max(30, int(doc_height + 5)))
@@ -164,101 +306,28 @@ class ToastNotification(QWidget):
 
     def _markdown_to_html(self, text: str) -> str:
         """Convert basic Markdown to HTML."""
-        html = text
-
-        # Error -> Correct pattern: **error** -> **correct** (red -> green)
-        # Support both ASCII arrow (->) and Unicode arrow (→)
-        # Use [^*]+ instead of .+? to avoid issues with greedy matching
-        html = re.sub(
-            r'\*\*([^*]+)\*\*\s*(?:->|→|=>|–>|—>)\s*\*\*([^*]+)\*\*',
-            rf'<b style="color: {Styles.DELETE_RED};">\1</b> → '
-            rf'<b style="color: {Styles.SUCCESS};">\2</b>',
-            html
-        )
-
-        # Also support pattern without bold: "error" -> "correct" or 'error' -> 'correct'
-        html = re.sub(
-            r'"([^"]+)"\s*(?:->|→|=>|–>|—>)\s*"([^"]+)"',
-            rf'<b style="color: {Styles.DELETE_RED};">\1</b> → '
-            rf'<b style="color: {Styles.SUCCESS};">\2</b>',
-            html
-        )
-        html = re.sub(
-            r"'([^']+)'\s*(?:->|→|=>|–>|—>)\s*'([^']+)'",
-            rf'<b style="color: {Styles.DELETE_RED};">\1</b> → '
-            rf'<b style="color: {Styles.SUCCESS};">\2</b>',
-            html
-        )
-
-        # Support pattern: error → correct (no bold/quotes, but with arrow)
-        # Matches single words or phrases with spaces (e.g., "что бы -> чтобы")
-        html = re.sub(
-            r'(?<![*"\'])([а-яА-Яa-zA-Z]+(?:\s+[а-яА-Яa-zA-Z]+)*)\s*(?:->|→|=>|–>|—>)\s*([а-яА-Яa-zA-Z]+(?:\s+[а-яА-Яa-zA-Z]+)*)(?![*"\'])',
-            rf'<b style="color: {Styles.DELETE_RED};">\1</b> → '
-            rf'<b style="color: {Styles.SUCCESS};">\2</b>',
-            html
-        )
-
-        # Regular Bold: **text** (for remaining bold that wasn't error->correct)
-        html = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', html)
-
-        # Italic: *text*
-        html = re.sub(r'(?<!\*)\*([^*]+?)\*(?!\*)', r'<i>\1</i>', html)
-
-        # Code: `text`
-        html = re.sub(
-            r'`(.+?)`',
-            r'<code style="background-color: #333; padding: 2px 5px; '
-            r'border-radius: 3px; font-family: Consolas, monospace;">\1</code>',
-            html
-        )
-
-        # Headers: ### text
-        html = re.sub(
-            r'^### (.+)$',
-            rf'<h4 style="color: {Styles.ACCENT}; margin: 8px 0 4px 0; '
-            rf'font-size: 13px;">\1</h4>',
-            html,
-            flags=re.MULTILINE
-        )
-        html = re.sub(
-            r'^## (.+)$',
-            rf'<h3 style="color: {Styles.ACCENT}; margin: 10px 0 5px 0; '
-            rf'font-size: 14px;">\1</h3>',
-            html,
-            flags=re.MULTILINE
-        )
-
-        # Bullet points: - text or * text (at start of line)
-        html = re.sub(
-            r'^[\-\*] (.+)$',
-            r'<div style="margin-left: 10px; margin-bottom: 3px;">'
-            r'<span style="color: #888;">•</span> \1</div>',
-            html,
-            flags=re.MULTILINE
-        )
-
-        # Numbered lists: 1. text
-        html = re.sub(
-            r'^(\d+)\. (.+)$',
-            r'<div style="margin-left: 10px; margin-bottom: 3px;">'
-            r'<span style="color: #888;">\1.</span> \2</div>',
-            html,
-            flags=re.MULTILINE
-        )
-
-        # Line breaks (but not after block elements)
-        html = re.sub(r'(?<!>)\n(?!<)', '<br>', html)
-
-        return (
-            f'<div style="font-family: Segoe UI, sans-serif; '
-            f'color: {Styles.TEXT}; line-height: 1.5;">{html}</div>'
-        )
+        if _MARKDOWN_CHARS.isdisjoint(text) and text[:1] not in _LIST_START_CHARS:
+            return _HTML_WRAPPER.format(text)
+        return _render_markdown(text)
+
+    def _track_screen(self, screen) -> None:
+        """Follow the given primary screen and cache its available geometry."""
+        if self._screen is not None:
+            try:
+                self._screen.availableGeometryChanged.disconnect(self._on_screen_geometry_changed)
+            except (TypeError, RuntimeError):
+                pass  # Old screen already gone
+        self._screen = screen
+        self._screen_geom = screen.availableGeometry()
+        screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
+
+    def _on_screen_geometry_changed(self, geometry) -> None:
+        """Update the cached work area (taskbar moved, resolution changed)."""
+        self._screen_geom = geometry
 
     def _position_on_screen(self) -> None:
         """Position toast at bottom-right of screen."""
-        desktop = QDesktopWidget()
-        screen_rect = desktop.availableGeometry(desktop.primaryScreen())
+        screen_rect = self._screen_geom
 
         margin = 15
         x = screen_rect.right() - self.width() - margin
@@ -270,23 +339,32 @@ class ToastNotification(QWidget):
         """Animate toast appearing."""
         self.setWindowOpacity(0)
 
+        # Blurred shadow is re-rendered on every frame; skip it while fading
+        self._shadow.setEnabled(False)
         self._animation = QPropertyAnimation(self, b"windowOpacity")
         self._animation.setDuration(200)
         self._animation.setStartValue(0)
         self._animation.setEndValue(1)
         self._animation.setEasingCurve(QEasingCurve.OutCubic)
+        self._animation.finished.connect(self._restore_shadow)
         self._animation.start()
 
     def _animate_out(self) -> None:
         """Animate toast disappearing."""
+        self._shadow.setEnabled(False)
         self._animation = QPropertyAnimation(self, b"windowOpacity")
         self._animation.setDuration(200)
         self._animation.setStartValue(1)
         self._animation.setEndValue(0)
         self._animation.setEasingCurve(QEasingCurve.InCubic)
         self._animation.finished.connect(self.hide)
+        self._animation.finished.connect(self._restore_shadow)
         self._animation.start()
 
+    def _restore_shadow(self) -> None:
+        """Re-enable the drop shadow once a fade animation has finished."""
+        self._shadow.setEnabled(True)
+
     def _on_close_timer(self) -> None:
         """Handle close timer timeout."""
         if self._is_hovered:
@@ -1,8 +1,14 @@
 """Centralized UI styles for ClipGen."""
 
+from functools import lru_cache
+
 
 class Styles:
-    """CSS styles for PyQt5 widgets."""
+    """CSS styles for PyQt5 widgets.
+
+    Builders are cached (per argument for the parameterized ones), so every
+    widget with the same look shares one string per style.
+    """
 
     # Colors
     BACKGROUND = "#1e1e1e"
@@ -34,6 +40,7 @@ class Styles:
     AUTO_SWITCH_BLUE = "#5085D0"
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def global_app_style() -> str:
         """Global application style (for QApplication)."""
         return """
@@ -48,6 +55,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def main_window() -> str:
         """Main window style."""
         return f"""
@@ -158,6 +166,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def button() -> str:
         """Standard button style."""
         return f"""
@@ -176,6 +185,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def mini_button(color: str, hover_color: str) -> str:
         """18x18 circular mini button."""
         return f"""
@@ -192,18 +202,21 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def add_button() -> str:
         """Green add button."""
         return Styles.mini_button(Styles.ADD_GREEN, Styles.ADD_GREEN_HOVER)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def delete_button() -> str:
         """Red delete button."""
         return Styles.mini_button(Styles.DELETE_RED, Styles.DELETE_RED_HOVER)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def test_button(status: str) -> str:
-        """Test button based on status."""
+        """Test button based on status (18x18 circle, plain dot)."""
         colors = {
             "success": (Styles.SUCCESS, Styles.SUCCESS_HOVER),
             "error": (Styles.ERROR, Styles.ERROR_HOVER),
@@ -211,9 +224,17 @@ class Styles:
             "not_tested": (Styles.NOT_TESTED, Styles.NOT_TESTED_HOVER)
         }
         color, hover = colors.get(status, (Styles.NOT_TESTED, Styles.NOT_TESTED_HOVER))
-        return Styles.mini_button(color, hover)
+        return f"""
+            QPushButton {{
+                background-color: {color};
+                color: {Styles.TEXT};
+                border-radius: 9px;
+            }}
+            QPushButton:hover {{ background-color: {hover}; }}
+        """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def toggle_button(active: bool) -> str:
         """Toggle button on/off state."""
         if active:
@@ -234,6 +255,28 @@ class Styles:
             """
 
     @staticmethod
+    @lru_cache(maxsize=None)
+    def switch_button(active: bool) -> str:
+        """Settings on/off switch (autostart, proxy) with a tiny dot."""
+        if active:
+            background, hover = Styles.TOGGLE_ON, f"background-color: {Styles.ADD_GREEN_HOVER};"
+        else:
+            background, hover = Styles.TOGGLE_OFF, "background-color: #DDDDDD; color: #000000;"
+        return f"""
+            QPushButton {{
+                background-color: {background};
+                color: {Styles.TEXT};
+                border-radius: 9px;
+                font-weight: bold;
+                font-size: 5px;
+                margin: 0px;
+                border: none;
+            }}
+            QPushButton:hover {{ {hover} }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def auto_switch_button(active: bool) -> str:
         """Auto-switch toggle button."""
         color = Styles.AUTO_SWITCH_BLUE if active else Styles.TOGGLE_OFF
@@ -252,6 +295,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def input_field() -> str:
         """Text input field."""
         return f"""
@@ -268,6 +312,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def text_edit() -> str:
         """Multi-line text edit."""
         return f"""
@@ -284,6 +329,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def card() -> str:
         """Card/frame container."""
         return f"""
@@ -295,6 +341,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def scroll_area() -> str:
         """Scroll area with hidden scrollbar."""
         return f"""
@@ -317,6 +364,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def text_browser() -> str:
         """Read-only text browser."""
         return f"""
@@ -330,6 +378,45 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
+    def log_area() -> str:
+        """Monospace read-only log view (QPlainTextEdit)."""
+        return f"""
+            QPlainTextEdit {{
+                background-color: {Styles.CARD_BG};
+                color: {Styles.TEXT};
+                border: none;
+                border-radius: 10px;
+                padding: 15px;
+                line-height: 1.5;
+                font-family: 'Consolas', 'Courier New', monospace;
+                selection-background-color: {Styles.ACCENT};
+                selection-color: {Styles.BACKGROUND};
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def log_button(hover_color: str = "#444444", pressed_color: str = BUTTON_PRESSED) -> str:
+        """Compact button under the log view."""
+        return f"""
+            QPushButton {{
+                background-color: {Styles.BUTTON_BG};
+                border-radius: 8px;
+                padding: 5px 10px;
+                font-size: 12px;
+            }}
+            QPushButton:hover {{
+                background-color: {hover_color};
+                color: {Styles.TEXT};
+            }}
+            QPushButton:pressed {{
+                background-color: {pressed_color};
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def combo_box() -> str:
         """Combo box dropdown."""
         return f"""
@@ -354,6 +441,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def radio_button() -> str:
         """Radio button."""
         return f"""
@@ -378,6 +466,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def nav_button() -> str:
         """Navigation tab button - single stylesheet for all states.
 
@@ -404,6 +493,170 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
+    def hotkey_card() -> str:
+        """Hotkey card and all its children in one sheet (object-name selectors).
+
+        Toggles (#hkToggle) switch color via setProperty("active", "true"/"false")
+        with unpolish/polish, like nav_button.
+        """
+        field = f"""
+                border-radius: 8px;
+                border: 1px solid {Styles.BORDER};
+                background-color: #2a2a2a;
+        """
+        mini = f"""
+                color: {Styles.TEXT};
+                border-radius: 9px;
+                font-weight: bold;
+                font-size: 10px;
+        """
+        return f"""
+            QFrame {{
+                background-color: {Styles.CARD_BG};
+                border-radius: 15px;
+                padding: 10px;
+            }}
+            QKeySequenceEdit {{
+                background-color: {Styles.BUTTON_BG};
+                color: {Styles.TEXT};
+                border-radius: 5px;
+                padding: 5px;
+                font-family: 'Consolas', 'Courier New', monospace;
+            }}
+            QLineEdit#hkColor, QLineEdit#hkColor * {{{field}
+                padding: 5px;
+            }}
+            QLineEdit#hkName, QLineEdit#hkName * {{{field}
+                padding: 8px;
+            }}
+            QLabel#hkLearningLabel {{
+                color: {Styles.TEXT};
+            }}
+            QWidget#hkLearningBox, QWidget#hkLearningBox * {{
+                background-color: transparent;
+            }}
+            QTextEdit#hkPrompt, QTextEdit#hkPrompt * {{{field}
+                padding: 8px;
+            }}
+            QPushButton#hkDelete {{{mini}
+                background-color: {Styles.DELETE_RED};
+            }}
+            QPushButton#hkDelete:hover {{
+                background-color: {Styles.DELETE_RED_HOVER};
+            }}
+            QPushButton#hkToggle {{{mini}
+                background-color: {Styles.TOGGLE_OFF};
+            }}
+            QPushButton#hkToggle:hover {{
+                background-color: #888888;
+            }}
+            QPushButton#hkToggle[active="true"] {{
+                background-color: {Styles.TOGGLE_ON};
+            }}
+            QPushButton#hkToggle[active="true"]:hover {{
+                background-color: {Styles.ADD_GREEN_HOVER};
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def settings_rows() -> str:
+        """Key/model rows of the settings tab (object-name selectors).
+
+        Set once on the container holding the rows instead of on every
+        radio, field and label.
+        """
+        return f"""
+            QRadioButton#rowRadio {{
+                spacing: 0;
+            }}
+            QRadioButton#rowRadio::indicator {{
+                width: 18px;
+                height: 18px;
+                border-radius: 9px;
+            }}
+            QRadioButton#rowRadio::indicator:unchecked {{
+                background-color: #353535;
+            }}
+            QRadioButton#rowRadio::indicator:unchecked:hover {{
+                background-color: #4f4f4f;
+            }}
+            QRadioButton#rowRadio::indicator:checked {{
+                background-color: qradialgradient(
+                    cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5,
+                    stop:0 #FFFFFF, stop:0.1 #FFFFFF,
+                    stop:0.21 {Styles.AUTO_SWITCH_BLUE}, stop:1 {Styles.AUTO_SWITCH_BLUE}
+                );
+            }}
+            QLineEdit#rowInput, QLineEdit#rowInput * {{
+                border-radius: 8px;
+                border: 1px solid {Styles.BORDER};
+                padding: 5px;
+                background-color: #2a2a2a;
+                color: {Styles.TEXT};
+            }}
+            QLabel#rowTime {{
+                color: #888888;
+                font-size: 12px;
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def pin_button() -> str:
+        """Transparent pin (always-on-top) button, accent color on hover."""
+        return f"""
+            QPushButton#pinButton {{
+                font-size: 16px;
+                background-color: transparent;
+                border: none;
+                color: #888888;
+            }}
+            QPushButton#pinButton:hover {{
+                color: {Styles.ACCENT};
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def action_button(color: str) -> str:
+        """Hotkey action button tinted with the hotkey log color."""
+        return f"""
+            QPushButton {{
+                color: {color};
+                background-color: {Styles.BUTTON_BG};
+                border-radius: 10px;
+                padding: 5px 10px;
+            }}
+            QPushButton:hover {{
+                background-color: {color};
+                color: {Styles.BUTTON_BG};
+            }}
+            QPushButton:pressed {{
+                background-color: {color}80;
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def dialog_button(hover_color: str) -> str:
+        """Dialog answer button, tinted with hover_color on hover."""
+        return f"""
+            QPushButton {{
+                background-color: {Styles.BUTTON_BG};
+                color: {Styles.TEXT};
+                border: none;
+                border-radius: 8px;
+                padding: 10px 0;
+            }}
+            QPushButton:hover {{
+                background-color: {hover_color};
+            }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def key_sequence_edit() -> str:
         """Key sequence input."""
         return f"""
@@ -420,6 +673,7 @@ class Styles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def checkable_button(checked: bool) -> str:
         """Checkable toggle button."""
         if checked:
@@ -1,11 +1,67 @@
 """Help tab - displays instructions and donation info."""
 
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextBrowser, QLineEdit,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QTextBrowser, QLineEdit,
     QPushButton, QLabel
 )
 from PyQt5.QtCore import Qt, QTimer
-import pyperclip
+from PyQt5.QtGui import QTextDocument
+
+
+# Distinct help pages kept (as HTML and as laid-out documents)
+_HELP_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=_HELP_CACHE_SIZE)
+def _render_help_html(help_items: tuple) -> str:
+    """Build help HTML from the (hashable) items of the "help" language section."""
+    get = dict(help_items).get
+
+    # Build list items
+    def build_list(items):
+        if not items:
+            return ""
+        return "<ul style='margin-left: 20px;'><li>" + "</li><li>".join(items) + "</li></ul>"
+
+    html = f"""
+    <h2 style='color: #A3BFFA; font-size: 20px;'>{get("welcome_title", "Welcome to ClipGen!")}</h2>
+    <p>{get("welcome_text", "This is your personal AI assistant.")}</p>
+
+    <hr style='border: 1px solid #333;'>
+
+    <h2 style='color: #A3BFFA; font-size: 16px;'>{get("how_it_works_title", "How It Works")}</h2>
+
+    <h3 style='color: #FFFFFF; font-size: 14px;'>{get("step1_title", "Step 1: Get an API Key")}</h3>
+    <p>{get("step1_text", "")}</p>
+    {build_list(get("step1_list", []))}
+
+    <h3 style='color: #FFFFFF; font-size: 14px;'>{get("step2_title", "Step 2: Select and Press")}</h3>
+    <p>{get("step2_text", "")}</p>
+
+    <h3 style='color: #FFFFFF; font-size: 14px;'>{get("step3_title", "Step 3: Watch the Tray Icon")}</h3>
+    <p>{get("step3_text", "")}</p>
+
+    <hr style='border: 1px solid #333;'>
+
+    <h2 style='color: #A3BFFA; font-size: 16px;'>{get("personalization_title", "Personalization")}</h2>
+    <p>{get("personalization_text", "")}</p>
+    {build_list(get("personalization_list", []))}
+
+    <hr style='border: 1px solid #333;'>
+
+    <h2 style='color: #A3BFFA; font-size: 16px;'>{get("feedback_title", "Feedback")}</h2>
+    <p>{get("feedback_text", "")}</p>
+    <p>{get("website_text", "")}</p>
+
+    <hr style='border: 1px solid #333;'>
+
+    <h2 style='color: #FAF089; font-size: 16px;'>{get("support_title", "Support the Project")}</h2>
+    <p style='color: #FBD38D;'>{get("support_text", "")}</p>
+    """
+
+    return html
 
 
 class HelpTab(QWidget):
@@ -13,9 +69,32 @@ class HelpTab(QWidget):
 
     DONATION_WALLET = "TYgsAvTkkrRqArgo3Q5BYMghbYn6DViVqQ"
 
+    _TRANSPARENT_BG = "background-color: transparent;"
+
+    # Copy button: green, briefly success-green after a copy
+    _COPY_STYLE = """
+        QPushButton {
+            background-color: #3D8948;
+            border-radius: 8px;
+            padding: 8px;
+        }
+        QPushButton:hover {
+            background-color: #2A6C34;
+        }
+    """
+    _COPIED_STYLE = """
+        QPushButton {
+            background-color: #28A745;
+            border-radius: 8px;
+            padding: 8px;
+        }
+    """
+
     def __init__(self, lang: dict, parent=None):
         super().__init__(parent)
         self.lang = lang
+        self._help_html = None  # HTML currently shown in help_browser
+        self._help_docs = {}  # {html: parsed QTextDocument}
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -44,14 +123,14 @@ class HelpTab(QWidget):
 
         # Donation section (footer, transparent background)
         donate_widget = QWidget()
-        donate_widget.setStyleSheet("background-color: transparent;")
+        donate_widget.setStyleSheet(self._TRANSPARENT_BG)
         donate_layout = QHBoxLayout(donate_widget)
         donate_layout.setContentsMargins(0, 0, 0, 0)
         donate_layout.setSpacing(10)
 
         # Label
         self.usdt_label = QLabel("USDT (TRC-20):")
-        self.usdt_label.setStyleSheet("background-color: transparent;")
+        self.usdt_label.setStyleSheet(self._TRANSPARENT_BG)
         donate_layout.addWidget(self.usdt_label)
 
         # Wallet input
@@ -70,98 +149,55 @@ class HelpTab(QWidget):
         donate_layout.addWidget(self.wallet_input)
 
         # Copy button (green)
-        self.original_copy_style = """
-            QPushButton {
-                background-color: #3D8948;
-                border-radius: 8px;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #2A6C34;
-            }
-        """
-
         help_lang = self.lang.get("help", {})
         self.copy_button = QPushButton(help_lang.get("copy_button", "Copy"))
         self.copy_button.setToolTip(self.lang.get("tooltips", {}).get("copy_wallet", "Copy wallet address"))
         self.copy_button.setFixedWidth(110)
-        self.copy_button.setStyleSheet(self.original_copy_style)
+        self.copy_button.setStyleSheet(self._COPY_STYLE)
         self.copy_button.clicked.connect(self._copy_wallet)
         donate_layout.addWidget(self.copy_button)
 
         layout.addWidget(donate_widget)
 
     def _build_help_html(self) -> str:
-        """Build help HTML from language file."""
+        """Build help HTML from language file (cached per help section content)."""
         help_lang = self.lang.get("help", {})
-
-        # Build list items
-        def build_list(items):
-            if not items:
-                return ""
-            html = "<ul style='margin-left: 20px;'>"
-            for item in items:
-                html += f"<li>{item}</li>"
-            html += "</ul>"
-            return html
-
-        html = f"""
-        <h2 style='color: #A3BFFA; font-size: 20px;'>{help_lang.get("welcome_title", "Welcome to ClipGen!")}</h2>
-        <p>{help_lang.get("welcome_text", "This is your personal AI assistant.")}</p>
-
-        <hr style='border: 1px solid #333;'>
-
-        <h2 style='color: #A3BFFA; font-size: 16px;'>{help_lang.get("how_it_works_title", "How It Works")}</h2>
-
-        <h3 style='color: #FFFFFF; font-size: 14px;'>{help_lang.get("step1_title", "Step 1: Get an API Key")}</h3>
-        <p>{help_lang.get("step1_text", "")}</p>
-        {build_list(help_lang.get("step1_list", []))}
-
-        <h3 style='color: #FFFFFF; font-size: 14px;'>{help_lang.get("step2_title", "Step 2: Select and Press")}</h3>
-        <p>{help_lang.get("step2_text", "")}</p>
-
-        <h3 style='color: #FFFFFF; font-size: 14px;'>{help_lang.get("step3_title", "Step 3: Watch the Tray Icon")}</h3>
-        <p>{help_lang.get("step3_text", "")}</p>
-
-        <hr style='border: 1px solid #333;'>
-
-        <h2 style='color: #A3BFFA; font-size: 16px;'>{help_lang.get("personalization_title", "Personalization")}</h2>
-        <p>{help_lang.get("personalization_text", "")}</p>
-        {build_list(help_lang.get("personalization_list", []))}
-
-        <hr style='border: 1px solid #333;'>
-
-        <h2 style='color: #A3BFFA; font-size: 16px;'>{help_lang.get("feedback_title", "Feedback")}</h2>
-        <p>{help_lang.get("feedback_text", "")}</p>
-        <p>{help_lang.get("website_text", "")}</p>
-
-        <hr style='border: 1px solid #333;'>
-
-        <h2 style='color: #FAF089; font-size: 16px;'>{help_lang.get("support_title", "Support the Project")}</h2>
-        <p style='color: #FBD38D;'>{help_lang.get("support_text", "")}</p>
-        """
-
-        return html
+        help_items = tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in help_lang.items()
+        )
+        return _render_help_html(help_items)
 
     def _update_help_content(self) -> None:
-        """Update help browser content."""
-        self.help_browser.setHtml(self._build_help_html())
+        """Update help browser content, reusing documents parsed earlier."""
+        html = self._build_help_html()
+        if html is self._help_html:
+            return
+        self._help_html = html
+
+        doc = self._help_docs.get(html)
+        if doc is None:
+            if len(self._help_docs) >= _HELP_CACHE_SIZE:
+                oldest = next(iter(self._help_docs))
+                self._help_docs.pop(oldest).deleteLater()
+            doc = QTextDocument(self.help_browser)
+            doc.setDefaultFont(self.help_browser.font())
+            doc.setHtml(html)
+            self._help_docs[html] = doc
+        else:
+            # The widget font may have changed while this document was hidden
+            doc.setDefaultFont(self.help_browser.font())
+        self.help_browser.setDocument(doc)
 
     def _copy_wallet(self) -> None:
         """Copy wallet address to clipboard with visual feedback."""
-        pyperclip.copy(self.DONATION_WALLET)
+        QApplication.clipboard().setText(self.DONATION_WALLET)
 
         help_lang = self.lang.get("help", {})
 
         # Change button to "Copied" state
         self.copy_button.setText(help_lang.get("copied", "Copied!"))
-        self.copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28A745;
-                border-radius: 8px;
-                padding: 8px;
-            }
-        """)
+        self.copy_button.setStyleSheet(self._COPIED_STYLE)
 
         # Reset after 1 second
         QTimer.singleShot(1000, self._reset_copy_button)
@@ -170,7 +206,7 @@ class HelpTab(QWidget):
         """Reset copy button to original state."""
         help_lang = self.lang.get("help", {})
         self.copy_button.setText(help_lang.get("copy_button", "Copy"))
-        self.copy_button.setStyleSheet(self.original_copy_style)
+        self.copy_button.setStyleSheet(self._COPY_STYLE)
 
     def update_language(self, lang: dict) -> None:
         """Update UI text with new language."""
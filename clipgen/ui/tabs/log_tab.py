@@ -1,28 +1,167 @@
 """Log tab - displays application logs."""
 
+import html
 import re
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextBrowser, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QScrollArea
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QTextCursor
+from PyQt5.QtCore import Qt, QTimer
 
 from ..styles import Styles
 
+# Learning-mode explanation patterns, compiled once at import.
+# Arrow alternatives: ASCII (->, =>) and Unicode (→, –>, —>).
+_ARROWS = r'\s*(?:->|→|=>|–>|—>)\s*'
+_WORDS = r'[а-яА-Яa-zA-Z]+(?:\s+[а-яА-Яa-zA-Z]+)*'
+
+# All error -> correct forms in one pattern: **bold**, "quoted"/'quoted',
+# or a whole line of plain words
+_PAT_ARROW = re.compile(
+    rf'\*\*(?P<b1>[^*]+)\*\*{_ARROWS}\*\*(?P<b2>[^*]+)\*\*'
+    rf'|["\'](?P<q1>[^"\']+)["\']{_ARROWS}["\'](?P<q2>[^"\']+)["\']'
+    rf'|^(?P<p1>{_WORDS}){_ARROWS}(?P<p2>{_WORDS})$'
+)
+_MD_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_MD_ITALIC = re.compile(r'(?<!\*)\*([^*]+)\*(?!\*)')
+
+# error -> correct replacement (red -> green)
+_ARROW_HTML = (
+    f'<span style="color: {Styles.DELETE_RED}; font-weight: bold;">{{}}</span>'
+    f' → <span style="color: {Styles.SUCCESS}; font-weight: bold;">{{}}</span>'
+)
+
+# One log line inside a batched HTML insertion (color, inner HTML)
+_LINE_HTML = '<div style="color: {}; white-space: pre-wrap;">{}</div>'
+
+# Fixed gray lines: separator before an action header, end of an explanation
+_SEPARATOR_HTML = _LINE_HTML.format("#888888", "<br>" + "─" * 40 + "<br>")
+_EXPLANATION_END_HTML = _LINE_HTML.format("#888888", "    └─────")
+
+# Rendered explanations kept for re-shown results (same text and hotkey)
+_EXPLANATION_CACHE_SIZE = 64
+
+
+def _arrow_repl(match) -> str:
+    """Format whichever error -> correct form matched."""
+    error = match["b1"] or match["q1"] or match["p1"]
+    correct = match["b2"] or match["q2"] or match["p2"]
+    return _ARROW_HTML.format(html.escape(error), html.escape(correct))
+
+
+def _arrow_line_html(line: str) -> tuple:
+    """Render error -> correct pairs in a line, escaping the text around them.
+
+    Returns:
+        (html, number of pairs found)
+    """
+    # Every arrow form ends in ">" or is "→"; most lines have neither
+    if ">" not in line and "→" not in line:
+        return line, 0
+
+    parts = []
+    pos = 0
+    for match in _PAT_ARROW.finditer(line):
+        parts.append(html.escape(line[pos:match.start()]))
+        parts.append(_arrow_repl(match))
+        pos = match.end()
+    if not parts:
+        return line, 0
+    parts.append(html.escape(line[pos:]))
+    return "".join(parts), len(parts) // 2
+
+
+@lru_cache(maxsize=_EXPLANATION_CACHE_SIZE)
+def _explanation_html(text: str, hotkey_color: str, header: str) -> str:
+    """Render a learning-mode explanation as one HTML fragment.
+
+    Args:
+        text: Explanation text from AI
+        hotkey_color: Color of the hotkey for base text
+        header: Localized title of the block
+    """
+    # Empty line and separator before explanation
+    parts = ["<br>", _LINE_HTML.format("#888888", html.escape(f"    ┌─ {header}"))]
+
+    # Process text line by line
+    for line in text.strip().split('\n'):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        # Check for error -> correct pattern (single pass over the line)
+        # **error** -> **correct** or "error" -> "correct"
+        html_line, arrow_count = _arrow_line_html(stripped)
+
+        if arrow_count:
+            # Remove remaining markdown bold
+            html_line = _MD_BOLD.sub(r'<b>\1</b>', html_line)
+            # Convert *text* to italic
+            html_line = _MD_ITALIC.sub(r'<i>\1</i>', html_line)
+            parts.append(_LINE_HTML.format(hotkey_color, f"    │ {html_line}"))
+
+        elif stripped.startswith('*') and not stripped.startswith('**'):
+            # Italic rule explanation: *Rule: ...*
+            text_content = html.escape(stripped.strip('*'))
+            parts.append(_LINE_HTML.format("#AAAAAA", f"    │   {text_content}"))
+
+        else:
+            # Regular text in hotkey color
+            # Remove markdown formatting
+            clean_line = _MD_BOLD.sub(r'\1', stripped)
+            clean_line = _MD_ITALIC.sub(r'\1', clean_line)
+            parts.append(_LINE_HTML.format(hotkey_color, f"    │ {html.escape(clean_line)}"))
+
+    # End separator
+    parts.append(_EXPLANATION_END_HTML)
+
+    return "".join(parts)
+
 
 class LogTab(QWidget):
     """Tab for displaying application logs."""
 
+    MAX_LOG_BLOCKS = 5000  # Oldest lines are dropped beyond this
+    FLUSH_INTERVAL_MS = 16  # Lines logged within one frame are inserted together
+    ERROR_PREFIXES = ("Error:", "Ошибка:")  # Errors are logged as "Error: ..."
+
     def __init__(self, lang: dict, parent=None):
         super().__init__(parent)
         self.lang = lang
         self.config = None  # Will be set by main window
+        self._header_prefixes: tuple = ()
+        self._cache_log_strings()
         self._setup_ui()
 
+        # Pending HTML fragments, inserted into log_area by _flush_logs
+        self._pending: list = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_logs)
+
     def set_config(self, config: dict) -> None:
         """Set config reference for hotkey detection."""
         self.config = config
+        self.refresh_hotkeys()
+
+    def refresh_hotkeys(self) -> None:
+        """Rebuild action header prefixes after hotkeys were added, removed or renamed."""
+        hotkeys = self.config.get("hotkeys", []) if self.config else []
+        self._header_prefixes = tuple(
+            f"{h.get('combination', '')}: {h.get('name', '')}" for h in hotkeys
+        )
+
+    def _cache_log_strings(self) -> None:
+        """Cache the localized markers append_log classifies messages by."""
+        logs_lang = self.lang.get("logs", {})
+        errors_lang = self.lang.get("errors", {})
+
+        self._execution_time_key = logs_lang.get("execution_time", "Executed in").split()[0]
+        self._app_started_msg = logs_lang.get("app_started", "ClipGen started")
+        self._empty_clipboard_msg = errors_lang.get("empty_clipboard", "Clipboard is empty")
 
     def _setup_ui(self) -> None:
         """Set up the tab UI."""
@@ -30,24 +169,14 @@ class LogTab(QWidget):
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(10)
 
-        # Log area
-        self.log_area = QTextBrowser()
-        self.log_area.setStyleSheet("""
-            QTextBrowser {
-                background-color: #252525;
-                color: #FFFFFF;
-                border: none;
-                border-radius: 10px;
-                padding: 15px;
-                line-height: 1.5;
-                font-family: 'Consolas', 'Courier New', monospace;
-                selection-background-color: #A3BFFA;
-                selection-color: #1e1e1e;
-            }
-        """)
-        self.log_area.setOpenExternalLinks(True)
+        # Log area: plain-text layout with a bounded history
+        self.log_area = QPlainTextEdit()
+        self.log_area.setReadOnly(True)
+        self.log_area.setUndoRedoEnabled(False)
+        self.log_area.setMaximumBlockCount(self.MAX_LOG_BLOCKS)
+        self.log_area.setStyleSheet(Styles.log_area())
         self.log_area.setTextInteractionFlags(
-            Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard | Qt.LinksAccessibleByMouse
+            Qt.TextSelectableByMouse | Qt.TextSelectableByKeyboard
         )
         self.log_area.setCursorWidth(2)
         layout.addWidget(self.log_area, 1)
@@ -61,22 +190,7 @@ class LogTab(QWidget):
         # Clear logs button
         self.clear_button = QPushButton(logs_lang.get("clear_logs", "Clear logs"))
         self.clear_button.setToolTip(self.lang.get("tooltips", {}).get("clear_logs", "Clear all logs"))
-        self.clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 12px;
-                max-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-                color: #FFFFFF;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-        """)
+        self.clear_button.setStyleSheet(Styles.log_button())
         self.clear_button.setMaximumWidth(150)
         self.clear_button.clicked.connect(self.clear_logs)
         button_layout.addWidget(self.clear_button)
@@ -88,44 +202,14 @@ class LogTab(QWidget):
         self.check_updates_button.setToolTip(
             self.lang.get("tooltips", {}).get("check_updates", "Check for new versions on GitHub")
         )
-        self.check_updates_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 12px;
-                max-width: 180px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-                color: #FFFFFF;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-        """)
+        self.check_updates_button.setStyleSheet(Styles.log_button())
         self.check_updates_button.setMaximumWidth(180)
         button_layout.addWidget(self.check_updates_button)
 
         # Stop button (gray by default, red on hover like original)
         self.stop_button = QPushButton(logs_lang.get("stop_task", "Stop"))
         self.stop_button.setToolTip(self.lang.get("tooltips", {}).get("stop_task", "Stop current task"))
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 12px;
-                max-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #c82333;
-                color: #FFFFFF;
-            }
-            QPushButton:pressed {
-                background-color: #a01c29;
-            }
-        """)
+        self.stop_button.setStyleSheet(Styles.log_button(Styles.ERROR_HOVER, "#a01c29"))
         self.stop_button.setMaximumWidth(150)
         button_layout.addWidget(self.stop_button)
 
@@ -134,22 +218,7 @@ class LogTab(QWidget):
             logs_lang.get("instructions", "Instructions")
         )
         self.instructions_button.setToolTip(self.lang.get("tooltips", {}).get("instructions", "Show instructions"))
-        self.instructions_button.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                border-radius: 8px;
-                padding: 5px 10px;
-                font-size: 12px;
-                max-width: 150px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-                color: #FFFFFF;
-            }
-            QPushButton:pressed {
-                background-color: #2a2a2a;
-            }
-        """)
+        self.instructions_button.setStyleSheet(Styles.log_button())
         self.instructions_button.setMaximumWidth(150)
         button_layout.addWidget(self.instructions_button)
 
@@ -158,6 +227,8 @@ class LogTab(QWidget):
 
     def clear_logs(self) -> None:
         """Clear the log area."""
+        self._flush_timer.stop()
+        self._pending.clear()
         self.log_area.clear()
 
     def append_log(self, message: str, color: str = "#FFFFFF") -> None:
@@ -167,74 +238,93 @@ class LogTab(QWidget):
             message: Log message
             color: Text color (hex)
         """
-        self.log_area.moveCursor(QTextCursor.End)
-
-        logs_lang = self.lang.get("logs", {})
-        errors_lang = self.lang.get("errors", {})
-
-        execution_time_key = logs_lang.get("execution_time", "Executed in").split()[0]
-        app_started_msg = logs_lang.get("app_started", "ClipGen started")
-        empty_clipboard_msg = errors_lang.get("empty_clipboard", "Clipboard is empty")
-
-        # Check if this is an action header (combination: name - timestamp)
-        is_action_header = False
-        if self.config:
-            for hotkey in self.config.get("hotkeys", []):
-                combo = hotkey.get("combination", "")
-                name = hotkey.get("name", "")
-                if f"{combo}: {name}" in message:
-                    is_action_header = True
-                    break
+        # Action headers are emitted as "combination: name - timestamp"
+        is_action_header = message.startswith(self._header_prefixes)
 
         # Determine log type for formatting
-        if execution_time_key in message:
+        if self._execution_time_key in message:
             # Execution time message - gray with indent
-            self.log_area.setTextColor(QColor("#888888"))
-            self.log_area.append(f"    {message}")
+            self._append_line(f"    {message}", "#888888")
 
         elif is_action_header:
             # Action header - add separator before
-            self.log_area.setTextColor(QColor(color))
+            if self._pending or not self.log_area.document().isEmpty():
+                self._queue_html(_SEPARATOR_HTML)
 
-            cursor = self.log_area.textCursor()
-            if not cursor.atStart():
-                self.log_area.setTextColor(QColor("#888888"))
-                self.log_area.append("\n" + "─" * 40 + "\n")
+            self._append_line(message, color)
 
-            self.log_area.setTextColor(QColor(color))
-            self.log_area.append(message)
-
-        elif "Error:" in message or "Ошибка:" in message:
+        elif message.startswith(self.ERROR_PREFIXES):
             # Error message - red with indent
-            self.log_area.setTextColor(QColor("#FF5555"))
-            self.log_area.append(f"\n    ✗ {message}")
+            self._append_line(f"\n    ✗ {message}", "#FF5555")
 
-        elif empty_clipboard_msg in message:
+        elif message.startswith(self._empty_clipboard_msg):
             # Warning - yellow
-            self.log_area.setTextColor(QColor("#FFDD55"))
-            self.log_area.append(f"⚠️ {message}")
+            self._append_line(f"⚠️ {message}", "#FFDD55")
 
-        elif app_started_msg in message:
+        elif self._app_started_msg in message:
             # App started - just show the message
-            self.log_area.setTextColor(QColor(color))
-            self.log_area.append(message)
+            self._append_line(message, color)
 
         else:
             # Processing result or other message
-            self.log_area.setTextColor(QColor(color))
-
             # If it looks like AI response, add indentation
             if color != "#A3BFFA" and color != "#00FF00":  # Not welcome/system message
-                self.log_area.append(f"    {message}")
+                self._append_line(f"    {message}", color)
             else:
-                self.log_area.append(message)
+                self._append_line(message, color)
+
+    def _append_line(self, text: str, color: str) -> None:
+        """Queue plain text in the given color; newlines become line breaks."""
+        self._queue_html(
+            _LINE_HTML.format(color, html.escape(text).replace("\n", "<br>"))
+        )
+
+    def _queue_html(self, fragment: str) -> None:
+        """Queue an HTML fragment; bursts are flushed as one insertion."""
+        self._pending.append(fragment)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_logs(self) -> None:
+        """Insert all queued fragments at once, keeping the view pinned to the end."""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        fragment = "".join(self._pending)
+        self._pending.clear()
 
-        # Scroll to bottom
-        self.log_area.ensureCursorVisible()
+        # Follow new lines only if the user has not scrolled up to read older ones
+        scroll_bar = self.log_area.verticalScrollBar()
+        at_bottom = scroll_bar.value() >= scroll_bar.maximum() - 2
+
+        self.log_area.setUpdatesEnabled(False)
+        try:
+            self.log_area.appendHtml(fragment)
+        finally:
+            self.log_area.setUpdatesEnabled(True)
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def append_log_batch(self, lines) -> None:
+        """Append several plain log lines as one queued fragment.
+
+        Lines are indented like regular messages in append_log, without its
+        message-type detection (meant for blocks such as release notes).
+
+        Args:
+            lines: Iterable of (message, color) pairs
+        """
+        fragment = "".join(
+            _LINE_HTML.format(color, f"    {html.escape(message)}")
+            for message, color in lines
+        )
+        if fragment:
+            self._queue_html(fragment)
 
     def update_language(self, lang: dict) -> None:
         """Update UI text with new language."""
         self.lang = lang
+        self._cache_log_strings()
         logs_lang = lang.get("logs", {})
 
         self.clear_button.setText(logs_lang.get("clear_logs", "Clear logs"))
@@ -249,6 +339,8 @@ class LogTab(QWidget):
     def append_explanation_log(self, text: str, hotkey_color: str = "#FFFFFF") -> None:
         """Append learning mode explanation with colored formatting.
 
+        The whole block is rendered by _explanation_html and queued at once.
+
         Args:
             text: Explanation text from AI
             hotkey_color: Color of the hotkey for base text
@@ -256,99 +348,5 @@ class LogTab(QWidget):
         if not text or not text.strip():
             return
 
-        self.log_area.moveCursor(QTextCursor.End)
-
-        # Add empty line before explanation block
-        self.log_area.append("")
-
-        # Add separator before explanation
-        self.log_area.setTextColor(QColor("#888888"))
-        self.log_area.append("    ┌─ " + self.lang.get("logs", {}).get(
-            "learning_explanation", "Explanation:"
-        ))
-
-        # Process text line by line
-        lines = text.strip().split('\n')
-
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                continue
-
-            # Check for error -> correct pattern
-            # **error** -> **correct** or "error" -> "correct"
-            pattern_bold = re.search(
-                r'\*\*([^*]+)\*\*\s*(?:->|→|=>|–>|—>)\s*\*\*([^*]+)\*\*',
-                stripped
-            )
-            pattern_quotes = re.search(
-                r'["\']([^"\']+)["\']\s*(?:->|→|=>|–>|—>)\s*["\']([^"\']+)["\']',
-                stripped
-            )
-            pattern_plain = re.search(
-                r'^([а-яА-Яa-zA-Z]+(?:\s+[а-яА-Яa-zA-Z]+)*)\s*(?:->|→|=>|–>|—>)\s*([а-яА-Яa-zA-Z]+(?:\s+[а-яА-Яa-zA-Z]+)*)$',
-                stripped
-            )
-
-            if pattern_bold or pattern_quotes or pattern_plain:
-                pattern = pattern_bold or pattern_quotes or pattern_plain
-                error_word = pattern.group(1)
-                correct_word = pattern.group(2)
-
-                # Build HTML for this line
-                # Replace the matched pattern with colored version
-                html_line = stripped
-                if pattern_bold:
-                    html_line = re.sub(
-                        r'\*\*([^*]+)\*\*\s*(?:->|→|=>|–>|—>)\s*\*\*([^*]+)\*\*',
-                        f'<span style="color: {Styles.DELETE_RED}; font-weight: bold;">\\1</span>'
-                        f' → <span style="color: {Styles.SUCCESS}; font-weight: bold;">\\2</span>',
-                        html_line
-                    )
-                elif pattern_quotes:
-                    html_line = re.sub(
-                        r'["\']([^"\']+)["\']\s*(?:->|→|=>|–>|—>)\s*["\']([^"\']+)["\']',
-                        f'<span style="color: {Styles.DELETE_RED}; font-weight: bold;">\\1</span>'
-                        f' → <span style="color: {Styles.SUCCESS}; font-weight: bold;">\\2</span>',
-                        html_line
-                    )
-                elif pattern_plain:
-                    html_line = re.sub(
-                        r'^([а-яА-Яa-zA-Z]+(?:\s+[а-яА-Яa-zA-Z]+)*)\s*(?:->|→|=>|–>|—>)\s*([а-яА-Яa-zA-Z]+(?:\s+[а-яА-Яa-zA-Z]+)*)$',
-                        f'<span style="color: {Styles.DELETE_RED}; font-weight: bold;">\\1</span>'
-                        f' → <span style="color: {Styles.SUCCESS}; font-weight: bold;">\\2</span>',
-                        html_line
-                    )
-
-                # Remove remaining markdown bold
-                html_line = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', html_line)
-                # Convert *text* to italic
-                html_line = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'<i>\1</i>', html_line)
-
-                cursor = self.log_area.textCursor()
-                cursor.movePosition(QTextCursor.End)
-                cursor.insertHtml(
-                    f'<div style="color: {hotkey_color}; margin-left: 20px;">    │ {html_line}</div>'
-                )
-                self.log_area.append("")  # New line
-
-            elif stripped.startswith('*') and not stripped.startswith('**'):
-                # Italic rule explanation: *Rule: ...*
-                text_content = stripped.strip('*')
-                self.log_area.setTextColor(QColor("#AAAAAA"))
-                self.log_area.append(f"    │   {text_content}")
-
-            else:
-                # Regular text in hotkey color
-                # Remove markdown formatting
-                clean_line = re.sub(r'\*\*([^*]+)\*\*', r'\1', stripped)
-                clean_line = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', r'\1', clean_line)
-                self.log_area.setTextColor(QColor(hotkey_color))
-                self.log_area.append(f"    │ {clean_line}")
-
-        # End separator
-        self.log_area.setTextColor(QColor("#888888"))
-        self.log_area.append("    └─────")
-
-        # Scroll to bottom
-        self.log_area.ensureCursorVisible()
+        header = self.lang.get("logs", {}).get("learning_explanation", "Explanation:")
+        self._queue_html(_explanation_html(text, hotkey_color, header))
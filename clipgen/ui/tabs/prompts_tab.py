@@ -1,21 +1,40 @@
 """Prompts tab - hotkey configuration cards."""
 
+import re
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QLineEdit, QTextEdit, QFrame, QScrollArea, QKeySequenceEdit,
     QColorDialog
 )
 from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QKeySequence
 
 from ..styles import Styles
 from ..widgets import StyledComboBox
 
+_CARD_QSS = Styles.hotkey_card()
+_HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}")
+_color_dialog = None
+
+
+def _shared_color_dialog(parent: QWidget) -> QColorDialog:
+    """Return the color dialog reused by every card, creating it on first use.
+
+    The dialog is owned by the top-level window so it survives cards being
+    deleted when hotkeys are removed.
+    """
+    global _color_dialog
+    if _color_dialog is None:
+        _color_dialog = QColorDialog(parent.window())
+    return _color_dialog
+
 
 class FocusExpandingTextEdit(QTextEdit):
     """TextEdit that expands on focus and text change."""
 
     focusIn = pyqtSignal()
+    focusOut = pyqtSignal()
 
     def __init__(self, text: str = "", parent=None):
         super().__init__(parent)
@@ -26,6 +45,10 @@ class FocusExpandingTextEdit(QTextEdit):
         self.focusIn.emit()
         super().focusInEvent(event)
 
+    def focusOutEvent(self, event):
+        self.focusOut.emit()
+        super().focusOutEvent(event)
+
 
 class HotkeyCard(QFrame):
     """Card widget for a single hotkey configuration."""
@@ -41,23 +64,32 @@ class HotkeyCard(QFrame):
     learning_mode_changed = pyqtSignal(int, bool)
     learning_prompt_changed = pyqtSignal(int, str)
 
+    TEXT_EMIT_DELAY_MS = 200  # Typed text is emitted once the user pauses
+
     def __init__(self, index: int, hotkey: dict, lang: dict, config: dict, parent=None):
         super().__init__(parent)
         self.index = index
         self.hotkey = hotkey
         self.lang = lang
         self.config = config
+        self._sized = False
+        self._swatch_color = None
         self._setup_ui()
 
+    def showEvent(self, event) -> None:
+        """Fit the prompt editor once the card first gets its real width."""
+        super().showEvent(event)
+        if not self._sized:
+            self._sized = True
+            self._adjust_prompt_height()
+
     def _setup_ui(self) -> None:
         """Set up the card UI."""
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #252525;
-                border-radius: 15px;
-                padding: 10px;
-            }
-        """)
+        settings_lang = self.lang.get("settings", {})
+        tooltips = self.lang.get("tooltips", {})
+
+        # One sheet styles the whole card; children are matched by object name
+        self.setStyleSheet(_CARD_QSS)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
@@ -69,16 +101,7 @@ class HotkeyCard(QFrame):
 
         # Key sequence
         self.hotkey_edit = QKeySequenceEdit(self.hotkey.get("combination", ""))
-        self.hotkey_edit.setToolTip(self.lang.get("tooltips", {}).get("hotkey_input", ""))
-        self.hotkey_edit.setStyleSheet("""
-            QKeySequenceEdit {
-                background-color: #333333;
-                color: white;
-                border-radius: 5px;
-                padding: 5px;
-                font-family: 'Consolas', 'Courier New', monospace;
-            }
-        """)
+        self.hotkey_edit.setToolTip(tooltips.get("hotkey_input", ""))
         self.hotkey_edit.keySequenceChanged.connect(self._on_combination_changed)
         header.addWidget(self.hotkey_edit)
 
@@ -86,24 +109,20 @@ class HotkeyCard(QFrame):
         color_layout = QHBoxLayout()
         color_layout.setSpacing(5)
 
-        color_label = QLabel(self.lang.get("settings", {}).get("log_color_label", "Log color:"))
-        color_layout.addWidget(color_label)
+        self.color_label = QLabel(settings_lang.get("log_color_label", "Log color:"))
+        color_layout.addWidget(self.color_label)
 
         color = self.hotkey.get("log_color", "#FFFFFF")
         self.color_input = QLineEdit(color.replace("#", ""))
         self.color_input.setFixedWidth(70)
-        self.color_input.setStyleSheet("""
-            border-radius: 8px;
-            border: 1px solid #444444;
-            padding: 5px;
-            background-color: #2a2a2a;
-        """)
-        self.color_input.textChanged.connect(self._on_color_text_changed)
+        self.color_input.setObjectName("hkColor")
+        # User edits only: the picker sets the text itself and emits once
+        self.color_input.textEdited.connect(self._on_color_text_changed)
         color_layout.addWidget(self.color_input)
 
         self.color_button = QPushButton()
         self.color_button.setFixedSize(20, 20)
-        self.color_button.setToolTip(self.lang.get("tooltips", {}).get("color_picker", ""))
+        self.color_button.setToolTip(tooltips.get("color_picker", ""))
         self._update_color_button(color)
         self.color_button.clicked.connect(self._open_color_picker)
         color_layout.addWidget(self.color_button)
@@ -111,69 +130,49 @@ class HotkeyCard(QFrame):
         header.addLayout(color_layout)
 
         # Delete button (18x18 circle)
-        delete_btn = QPushButton("•")
-        delete_btn.setToolTip(self.lang.get("tooltips", {}).get("delete_hotkey", ""))
-        delete_btn.setFixedSize(18, 18)
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FF5F57;
-                color: white;
-                border-radius: 9px;
-                font-weight: bold;
-                font-size: 10px;
-            }
-            QPushButton:hover { background-color: #FF3B30; }
-        """)
-        delete_btn.clicked.connect(lambda: self.deleted.emit(self.index))
-        header.addWidget(delete_btn)
+        self.delete_button = QPushButton("•")
+        self.delete_button.setToolTip(tooltips.get("delete_hotkey", ""))
+        self.delete_button.setFixedSize(18, 18)
+        self.delete_button.setObjectName("hkDelete")
+        self.delete_button.clicked.connect(lambda: self.deleted.emit(self.index))
+        header.addWidget(self.delete_button)
 
         layout.addLayout(header)
 
         # Action name field with label
         name_layout = QHBoxLayout()
-        name_label = QLabel(self.lang.get("settings", {}).get("action_name_label", "Action name:"))
-        name_layout.addWidget(name_label)
+        self.name_label = QLabel(settings_lang.get("action_name_label", "Action name:"))
+        name_layout.addWidget(self.name_label)
 
         self.name_input = QLineEdit(self.hotkey.get("name", ""))
-        self.name_input.setStyleSheet("""
-            border-radius: 8px;
-            border: 1px solid #444444;
-            padding: 8px;
-            background-color: #2a2a2a;
-        """)
-        self.name_input.setToolTip(self.lang.get("tooltips", {}).get("action_name_input", ""))
-        self.name_input.textChanged.connect(
-            lambda text: self.name_changed.emit(self.index, text)
+        self.name_input.setObjectName("hkName")
+        self.name_input.setToolTip(tooltips.get("action_name_input", ""))
+        # Emit once per pause in typing (each emit saves the config);
+        # focus-out emits a pending edit right away
+        self._name_timer = self._make_emit_timer(self._emit_name)
+        self.name_input.textEdited.connect(lambda _: self._name_timer.start())
+        self.name_input.editingFinished.connect(
+            lambda: self._flush_emit_timer(self._name_timer)
         )
         name_layout.addWidget(self.name_input)
         layout.addLayout(name_layout)
 
         # Prompt field with label and auto-height
-        prompt_label = QLabel(self.lang.get("settings", {}).get("prompt_label", "Prompt:"))
-        layout.addWidget(prompt_label)
+        self.prompt_label = QLabel(settings_lang.get("prompt_label", "Prompt:"))
+        layout.addWidget(self.prompt_label)
 
         self.prompt_input = FocusExpandingTextEdit(self.hotkey.get("prompt", ""))
-        self.prompt_input.setStyleSheet("""
-            border-radius: 8px;
-            border: 1px solid #444444;
-            padding: 8px;
-            background-color: #2a2a2a;
-        """)
-        self.prompt_input.setToolTip(self.lang.get("tooltips", {}).get("prompt_input", ""))
+        self.prompt_input.setObjectName("hkPrompt")
+        self.prompt_input.setToolTip(tooltips.get("prompt_input", ""))
 
         # Auto-height adjustment
-        def adjust_height():
-            doc_height = self.prompt_input.document().size().height()
-            new_height = max(80, min(250, doc_height + 30))
-            self.prompt_input.setMinimumHeight(int(new_height))
-            self.prompt_input.setMaximumHeight(int(new_height))
-
-        self.prompt_input.focusIn.connect(adjust_height)
-        self.prompt_input.textChanged.connect(adjust_height)
-        self.prompt_input.textChanged.connect(self._on_prompt_changed)
-
-        # Initial height adjustment
-        QTimer.singleShot(0, adjust_height)
+        self.prompt_input.focusIn.connect(self._adjust_prompt_height)
+        self.prompt_input.textChanged.connect(self._adjust_prompt_height)
+        self._prompt_timer = self._make_emit_timer(self._on_prompt_changed)
+        self.prompt_input.textChanged.connect(self._prompt_timer.start)
+        self.prompt_input.focusOut.connect(
+            lambda: self._flush_emit_timer(self._prompt_timer)
+        )
 
         layout.addWidget(self.prompt_input)
 
@@ -183,8 +182,48 @@ class HotkeyCard(QFrame):
         # Learning mode section
         self._setup_learning_mode_section(layout)
 
+    @staticmethod
+    def _set_toggle_active(button: QPushButton, active: bool) -> None:
+        """Switch a card toggle between its on/off colors (see Styles.hotkey_card)."""
+        button.setProperty("active", "true" if active else "false")
+        # Force style refresh without changing stylesheet
+        button.style().unpolish(button)
+        button.style().polish(button)
+
+    def _adjust_prompt_height(self) -> None:
+        """Fit the prompt editor to its content (80-250 px)."""
+        doc_height = self.prompt_input.document().size().height()
+        new_height = int(max(80, min(250, doc_height + 30)))
+        # Typing within a line keeps the height; skip the two setter calls
+        if new_height == self.prompt_input.maximumHeight():
+            return
+        self.prompt_input.setMinimumHeight(new_height)
+        self.prompt_input.setMaximumHeight(new_height)
+
+    def _make_emit_timer(self, slot) -> QTimer:
+        """Create a single-shot timer that delays an outward text emit."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.TEXT_EMIT_DELAY_MS)
+        timer.timeout.connect(slot)
+        return timer
+
+    @staticmethod
+    def _flush_emit_timer(timer: QTimer) -> None:
+        """Fire a pending delayed emit immediately."""
+        if timer.isActive():
+            timer.stop()
+            timer.timeout.emit()
+
+    def _emit_name(self) -> None:
+        """Emit the current action name."""
+        self.name_changed.emit(self.index, self.name_input.text())
+
     def _update_color_button(self, color: str) -> None:
-        """Update color button appearance."""
+        """Update color button appearance (restyled only when the color changes)."""
+        if color == self._swatch_color:
+            return
+        self._swatch_color = color
         self.color_button.setStyleSheet(f"""
             background-color: {color};
             border-radius: 5px;
@@ -199,7 +238,8 @@ class HotkeyCard(QFrame):
     def _on_color_text_changed(self, text: str) -> None:
         """Handle color text change."""
         color = f"#{text}" if not text.startswith("#") else text
-        if len(color) == 7:
+        # Only complete, valid hex values that differ from the current one
+        if _HEX_COLOR.fullmatch(color) and color != self._swatch_color:
             self._update_color_button(color)
             self.color_changed.emit(self.index, color)
 
@@ -209,9 +249,12 @@ class HotkeyCard(QFrame):
 
     def _open_color_picker(self) -> None:
         """Open color picker dialog."""
-        current = QColor(f"#{self.color_input.text()}")
-        color = QColorDialog.getColor(current, self)
-        if color.isValid():
+        dialog = _shared_color_dialog(self)
+        dialog.setCurrentColor(QColor(f"#{self.color_input.text()}"))
+        if dialog.exec_() != QColorDialog.Accepted:
+            return
+        color = dialog.selectedColor()
+        if color.isValid() and color.name() != self._swatch_color:
             hex_color = color.name()
             self.color_input.setText(hex_color.replace("#", ""))
             self._update_color_button(hex_color)
@@ -219,15 +262,20 @@ class HotkeyCard(QFrame):
 
     def _setup_custom_model_section(self, layout: QVBoxLayout) -> None:
         """Set up custom model selection UI."""
+        settings_lang = self.lang.get("settings", {})
+
         custom_model_layout = QHBoxLayout()
         custom_model_layout.setSpacing(8)
 
         # Label
-        label = QLabel(self.lang.get("settings", {}).get("custom_model_label", "Custom model:"))
-        custom_model_layout.addWidget(label)
+        self.custom_model_label = QLabel(
+            settings_lang.get("custom_model_label", "Custom model:")
+        )
+        custom_model_layout.addWidget(self.custom_model_label)
 
         # Toggle button (18x18)
         self.use_custom_model_btn = QPushButton("•")
+        self.use_custom_model_btn.setObjectName("hkToggle")
         self.use_custom_model_btn.setFixedSize(18, 18)
         self.use_custom_model_btn.setCheckable(True)
         is_custom = self.hotkey.get("use_custom_model", False)
@@ -239,10 +287,10 @@ class HotkeyCard(QFrame):
         # Provider combo
         self.custom_provider_combo = StyledComboBox()
         self.custom_provider_combo.addItem(
-            self.lang.get("settings", {}).get("provider_gemini", "Gemini"), "gemini"
+            settings_lang.get("provider_gemini", "Gemini"), "gemini"
         )
         self.custom_provider_combo.addItem(
-            self.lang.get("settings", {}).get("provider_openai", "OpenAI Compatible"), "openai"
+            settings_lang.get("provider_openai", "OpenAI Compatible"), "openai"
         )
         self.custom_provider_combo.setEnabled(is_custom)
         self.custom_provider_combo.setMinimumWidth(150)
@@ -268,28 +316,7 @@ class HotkeyCard(QFrame):
 
     def _update_custom_model_toggle_style(self, checked: bool) -> None:
         """Update toggle button style based on state."""
-        if checked:
-            self.use_custom_model_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3D8948;
-                    color: white;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-                QPushButton:hover { background-color: #2A6C34; }
-            """)
-        else:
-            self.use_custom_model_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #676664;
-                    color: white;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-                QPushButton:hover { background-color: #888888; }
-            """)
+        self._set_toggle_active(self.use_custom_model_btn, checked)
 
     def _on_use_custom_model_toggled(self, checked: bool) -> None:
         """Handle custom model toggle."""
@@ -334,20 +361,24 @@ class HotkeyCard(QFrame):
 
     def _setup_learning_mode_section(self, layout: QVBoxLayout) -> None:
         """Set up learning mode UI."""
+        settings_lang = self.lang.get("settings", {})
+        tooltips = self.lang.get("tooltips", {})
+
         learning_layout = QHBoxLayout()
         learning_layout.setSpacing(8)
 
         # Label with brief explanation
-        mode_text = self.lang.get("settings", {}).get("learning_mode_label", "Learning mode:")
-        hint_text = self.lang.get("settings", {}).get(
+        mode_text = settings_lang.get("learning_mode_label", "Learning mode:")
+        hint_text = settings_lang.get(
             "learning_mode_hint", "(explains AI corrections in popup)"
         )
-        label = QLabel(f"{mode_text} {hint_text}")
-        label.setStyleSheet("color: #FFFFFF;")
-        learning_layout.addWidget(label)
+        self.learning_label = QLabel(f"{mode_text} {hint_text}")
+        self.learning_label.setObjectName("hkLearningLabel")
+        learning_layout.addWidget(self.learning_label)
 
         # Toggle button (18x18)
         self.learning_mode_btn = QPushButton("•")
+        self.learning_mode_btn.setObjectName("hkToggle")
         self.learning_mode_btn.setFixedSize(18, 18)
         self.learning_mode_btn.setCheckable(True)
         is_learning = self.hotkey.get("learning_mode", False)
@@ -355,7 +386,7 @@ class HotkeyCard(QFrame):
         self._update_learning_mode_toggle_style(is_learning)
         self.learning_mode_btn.toggled.connect(self._on_learning_mode_toggled)
         self.learning_mode_btn.setToolTip(
-            self.lang.get("tooltips", {}).get(
+            tooltips.get(
                 "learning_mode_toggle",
                 "Enable to see explanations of AI corrections"
             )
@@ -365,9 +396,19 @@ class HotkeyCard(QFrame):
         learning_layout.addStretch()
         layout.addLayout(learning_layout)
 
-        # Learning prompt field (initially hidden if mode is off)
+        # Learning prompt field: built on first enable (hidden while mode is off)
+        self._card_layout = layout
+        self.learning_prompt_container = None
+        self._learning_expanded = False
+        if is_learning:
+            self._build_learning_prompt()
+
+    def _build_learning_prompt(self) -> None:
+        """Create the learning prompt editor below the learning mode row."""
+        tooltips = self.lang.get("tooltips", {})
+
         self.learning_prompt_container = QWidget()
-        self.learning_prompt_container.setStyleSheet("background-color: transparent;")
+        self.learning_prompt_container.setObjectName("hkLearningBox")
         prompt_layout = QVBoxLayout(self.learning_prompt_container)
         prompt_layout.setContentsMargins(0, 5, 0, 0)
         prompt_layout.setSpacing(0)
@@ -379,14 +420,9 @@ class HotkeyCard(QFrame):
         )
 
         self.learning_prompt_input = FocusExpandingTextEdit(display_prompt)
-        self.learning_prompt_input.setStyleSheet("""
-            border-radius: 8px;
-            border: 1px solid #444444;
-            padding: 8px;
-            background-color: #2a2a2a;
-        """)
+        self.learning_prompt_input.setObjectName("hkPrompt")
         self.learning_prompt_input.setToolTip(
-            self.lang.get("tooltips", {}).get(
+            tooltips.get(
                 "learning_prompt_input",
                 "Custom prompt for generating explanations"
             )
@@ -395,59 +431,51 @@ class HotkeyCard(QFrame):
         # Start collapsed, expand on focus
         self.learning_prompt_input.setMinimumHeight(60)
         self.learning_prompt_input.setMaximumHeight(60)
-        self._learning_expanded = False
 
-        def expand_learning_prompt():
-            if not self._learning_expanded:
-                self._learning_expanded = True
-            # Calculate height based on content
-            doc_height = self.learning_prompt_input.document().size().height()
-            new_height = max(80, min(250, doc_height + 30))
-            self.learning_prompt_input.setMinimumHeight(int(new_height))
-            self.learning_prompt_input.setMaximumHeight(int(new_height))
-
-        self.learning_prompt_input.focusIn.connect(expand_learning_prompt)
-        self.learning_prompt_input.textChanged.connect(
-            lambda: expand_learning_prompt() if self._learning_expanded else None
+        # Content-based height only after the first focus; textChanged is
+        # connected then, so typing into the collapsed box does no layout work
+        self.learning_prompt_input.focusIn.connect(self._expand_learning_prompt)
+        self._learning_prompt_timer = self._make_emit_timer(self._on_learning_prompt_changed)
+        self.learning_prompt_input.textChanged.connect(self._learning_prompt_timer.start)
+        self.learning_prompt_input.focusOut.connect(
+            lambda: self._flush_emit_timer(self._learning_prompt_timer)
         )
-        self.learning_prompt_input.textChanged.connect(self._on_learning_prompt_changed)
 
         prompt_layout.addWidget(self.learning_prompt_input)
 
-        self.learning_prompt_container.setVisible(is_learning)
-        layout.addWidget(self.learning_prompt_container)
+        self._card_layout.addWidget(self.learning_prompt_container)
+
+    def _expand_learning_prompt(self) -> None:
+        """Expand the learning prompt editor to fit its content (80-250 px)."""
+        if not self._learning_expanded:
+            self._learning_expanded = True
+            self.learning_prompt_input.textChanged.connect(self._expand_learning_prompt)
+        # Calculate height based on content
+        doc_height = self.learning_prompt_input.document().size().height()
+        new_height = int(max(80, min(250, doc_height + 30)))
+        if new_height == self.learning_prompt_input.maximumHeight():
+            return
+        self.learning_prompt_input.setMinimumHeight(new_height)
+        self.learning_prompt_input.setMaximumHeight(new_height)
 
     def _update_learning_mode_toggle_style(self, checked: bool) -> None:
         """Update learning mode toggle button style."""
-        if checked:
-            self.learning_mode_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3D8948;
-                    color: white;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-                QPushButton:hover { background-color: #2A6C34; }
-            """)
-        else:
-            self.learning_mode_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #676664;
-                    color: white;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 10px;
-                }
-                QPushButton:hover { background-color: #888888; }
-            """)
+        self._set_toggle_active(self.learning_mode_btn, checked)
 
     def _on_learning_mode_toggled(self, checked: bool) -> None:
         """Handle learning mode toggle."""
         self._update_learning_mode_toggle_style(checked)
-        self.learning_prompt_container.setVisible(checked)
+        self._show_learning_prompt(checked)
         self.learning_mode_changed.emit(self.index, checked)
 
+    def _show_learning_prompt(self, visible: bool) -> None:
+        """Show or hide the learning prompt, building it on first show."""
+        if self.learning_prompt_container is None:
+            if visible:
+                self._build_learning_prompt()
+        else:
+            self.learning_prompt_container.setVisible(visible)
+
     def _on_learning_prompt_changed(self) -> None:
         """Handle learning prompt text change.
 
@@ -463,6 +491,118 @@ class HotkeyCard(QFrame):
         else:
             self.learning_prompt_changed.emit(self.index, current_text)
 
+    def update_language(self, lang: dict) -> None:
+        """Update labels and tooltips without rebuilding the card."""
+        self.lang = lang
+        settings_lang = lang.get("settings", {})
+        tooltips = lang.get("tooltips", {})
+
+        self.hotkey_edit.setToolTip(tooltips.get("hotkey_input", ""))
+        self.color_label.setText(settings_lang.get("log_color_label", "Log color:"))
+        self.color_button.setToolTip(tooltips.get("color_picker", ""))
+        self.delete_button.setToolTip(tooltips.get("delete_hotkey", ""))
+        self.name_label.setText(settings_lang.get("action_name_label", "Action name:"))
+        self.name_input.setToolTip(tooltips.get("action_name_input", ""))
+        self.prompt_label.setText(settings_lang.get("prompt_label", "Prompt:"))
+        self.prompt_input.setToolTip(tooltips.get("prompt_input", ""))
+
+        self.custom_model_label.setText(settings_lang.get("custom_model_label", "Custom model:"))
+        self.custom_provider_combo.setItemText(0, settings_lang.get("provider_gemini", "Gemini"))
+        self.custom_provider_combo.setItemText(
+            1, settings_lang.get("provider_openai", "OpenAI Compatible")
+        )
+
+        mode_text = settings_lang.get("learning_mode_label", "Learning mode:")
+        hint_text = settings_lang.get("learning_mode_hint", "(explains AI corrections in popup)")
+        self.learning_label.setText(f"{mode_text} {hint_text}")
+        self.learning_mode_btn.setToolTip(
+            tooltips.get("learning_mode_toggle", "Enable to see explanations of AI corrections")
+        )
+        if self.learning_prompt_container is None:
+            return  # Built later with the current language
+        self.learning_prompt_input.setToolTip(
+            tooltips.get("learning_prompt_input", "Custom prompt for generating explanations")
+        )
+
+        # An empty learning prompt means "use default": show the new language's one
+        if not self.hotkey.get("learning_prompt", ""):
+            self._set_learning_prompt_text(lang.get("default_learning_prompt", ""))
+
+    def update_from_hotkey(self, index: int, hotkey: dict) -> None:
+        """Show another hotkey in this card, touching only the values that differ.
+
+        Setters run with signals blocked, so nothing is emitted back upstream.
+        """
+        # Pending emits belong to the previous hotkey (focus-out already flushed them)
+        self._name_timer.stop()
+        self._prompt_timer.stop()
+        if self.learning_prompt_container is not None:
+            self._learning_prompt_timer.stop()
+
+        self.index = index
+        self.hotkey = hotkey
+
+        combination = hotkey.get("combination", "")
+        if self.hotkey_edit.keySequence().toString() != combination:
+            self.hotkey_edit.blockSignals(True)
+            self.hotkey_edit.setKeySequence(QKeySequence(combination))
+            self.hotkey_edit.blockSignals(False)
+
+        color = hotkey.get("log_color", "#FFFFFF")
+        if self.color_input.text() != color.replace("#", ""):
+            self.color_input.setText(color.replace("#", ""))
+            self._update_color_button(color)
+
+        name = hotkey.get("name", "")
+        if self.name_input.text() != name:
+            self.name_input.setText(name)
+
+        prompt = hotkey.get("prompt", "")
+        if self.prompt_input.toPlainText() != prompt:
+            self.prompt_input.blockSignals(True)
+            self.prompt_input.setPlainText(prompt)
+            self.prompt_input.blockSignals(False)
+            self._adjust_prompt_height()
+
+        is_custom = hotkey.get("use_custom_model", False)
+        if self.use_custom_model_btn.isChecked() != is_custom:
+            self.use_custom_model_btn.blockSignals(True)
+            self.use_custom_model_btn.setChecked(is_custom)
+            self.use_custom_model_btn.blockSignals(False)
+            self._update_custom_model_toggle_style(is_custom)
+            self.custom_provider_combo.setEnabled(is_custom)
+            self.custom_model_combo.setEnabled(is_custom)
+
+        self.custom_provider_combo.blockSignals(True)
+        self.custom_provider_combo.setCurrentIndex(
+            1 if hotkey.get("custom_provider") == "openai" else 0
+        )
+        self.custom_provider_combo.blockSignals(False)
+        self._populate_model_combo()
+
+        is_learning = hotkey.get("learning_mode", False)
+        if self.learning_mode_btn.isChecked() != is_learning:
+            self.learning_mode_btn.blockSignals(True)
+            self.learning_mode_btn.setChecked(is_learning)
+            self.learning_mode_btn.blockSignals(False)
+            self._update_learning_mode_toggle_style(is_learning)
+            self._show_learning_prompt(is_learning)
+
+        if self.learning_prompt_container is not None:
+            self._set_learning_prompt_text(
+                hotkey.get("learning_prompt", "") or self.lang.get("default_learning_prompt", "")
+            )
+
+    def _set_learning_prompt_text(self, text: str) -> None:
+        """Replace the learning prompt text without emitting a change."""
+        if self.learning_prompt_input.toPlainText() == text:
+            return
+        self.learning_prompt_input.blockSignals(True)
+        self.learning_prompt_input.setPlainText(text)
+        self.learning_prompt_input.blockSignals(False)
+        if self._learning_expanded:
+            self._expand_learning_prompt()
+
 
 class PromptsTab(QWidget):
     """Tab for managing hotkey prompts.
@@ -557,51 +697,48 @@ class PromptsTab(QWidget):
         self.refresh()
 
     def refresh(self) -> None:
-        """Refresh the hotkey cards."""
-        # Clear existing cards
-        for card in self.cards:
-            card.deleteLater()
-        self.cards.clear()
-
-        # Remove all widgets from cards layout
-        while self.cards_layout.count() > 0:
-            item = self.cards_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        # Add cards for each hotkey
-        for i, hotkey in enumerate(self.config.get("hotkeys", [])):
-            card = HotkeyCard(i, hotkey, self.lang, self.config)
-            card.deleted.connect(lambda idx: self.hotkey_deleted.emit(idx))
-            card.combination_changed.connect(
-                lambda idx, combo: self.combination_changed.emit(idx, combo)
-            )
-            card.name_changed.connect(
-                lambda idx, name: self.name_changed.emit(idx, name)
-            )
-            card.prompt_changed.connect(
-                lambda idx, prompt: self.prompt_changed.emit(idx, prompt)
-            )
-            card.color_changed.connect(
-                lambda idx, color: self.color_changed.emit(idx, color)
-            )
-            card.use_custom_model_changed.connect(
-                lambda idx, val: self.use_custom_model_changed.emit(idx, val)
-            )
-            card.custom_provider_changed.connect(
-                lambda idx, val: self.custom_provider_changed.emit(idx, val)
-            )
-            card.custom_model_changed.connect(
-                lambda idx, val: self.custom_model_changed.emit(idx, val)
-            )
-            card.learning_mode_changed.connect(
-                lambda idx, val: self.learning_mode_changed.emit(idx, val)
-            )
-            card.learning_prompt_changed.connect(
-                lambda idx, val: self.learning_prompt_changed.emit(idx, val)
-            )
-            self.cards_layout.addWidget(card)
-            self.cards.append(card)
+        """Sync the hotkey cards with config.
+
+        Existing cards are updated in place; only the difference in count is
+        created or deleted.
+        """
+        hotkeys = self.config.get("hotkeys", [])
+
+        # Repaint once after all cards are updated, not after each one
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            # Re-point surviving cards (indices shift after a deletion)
+            for i, (card, hotkey) in enumerate(zip(self.cards, hotkeys)):
+                card.update_from_hotkey(i, hotkey)
+
+            # Drop cards of removed hotkeys
+            while len(self.cards) > len(hotkeys):
+                card = self.cards.pop()
+                self.cards_layout.removeWidget(card)
+                card.deleteLater()
+
+            # Add cards for new hotkeys
+            for i in range(len(self.cards), len(hotkeys)):
+                self._add_card(i, hotkeys[i])
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+
+    def _add_card(self, i: int, hotkey: dict) -> None:
+        """Create a card for a hotkey and relay its signals."""
+        card = HotkeyCard(i, hotkey, self.lang, self.config)
+        # Relay card signals straight to the tab's signals (no Python hop)
+        card.deleted.connect(self.hotkey_deleted)
+        card.combination_changed.connect(self.combination_changed)
+        card.name_changed.connect(self.name_changed)
+        card.prompt_changed.connect(self.prompt_changed)
+        card.color_changed.connect(self.color_changed)
+        card.use_custom_model_changed.connect(self.use_custom_model_changed)
+        card.custom_provider_changed.connect(self.custom_provider_changed)
+        card.custom_model_changed.connect(self.custom_model_changed)
+        card.learning_mode_changed.connect(self.learning_mode_changed)
+        card.learning_prompt_changed.connect(self.learning_prompt_changed)
+        self.cards_layout.addWidget(card)
+        self.cards.append(card)
 
     def scroll_to_top(self) -> None:
         """Scroll to top of the list."""
@@ -621,5 +758,6 @@ class PromptsTab(QWidget):
             lang.get("tooltips", {}).get("add_hotkey", "Add hotkey")
         )
 
-        # Refresh cards with new language
-        self.refresh()
+        # Relabel cards in place
+        for card in self.cards:
+            card.update_language(lang)
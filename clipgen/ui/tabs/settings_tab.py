@@ -9,6 +9,8 @@ from PyQt5.QtCore import Qt, pyqtSignal
 from ..styles import Styles
 from ..widgets import StyledComboBox
 
+_ROWS_QSS = Styles.settings_rows()
+
 
 class SettingsTab(QWidget):
     """Tab for application settings."""
@@ -61,13 +63,13 @@ class SettingsTab(QWidget):
         self.lang = lang
         self._test_statuses = {}
 
-        # Store references to time labels for live updates
-        self.gemini_model_time_labels = {}
-        self.openai_model_time_labels = {}
-        self.gemini_key_test_buttons = {}
-        self.openai_key_test_buttons = {}
-        self.gemini_model_test_buttons = {}
-        self.openai_model_test_buttons = {}
+        # Widgets of each key/model row by provider; rows are updated in
+        # place on refresh and also serve the live test status/timer updates
+        self._key_rows = {"gemini": [], "openai": []}
+        self._model_rows = {"gemini": [], "openai": []}
+        # Hidden rows of deleted items, reused when the list grows again
+        self._key_pools = {"gemini": [], "openai": []}
+        self._model_pools = {"gemini": [], "openai": []}
 
         self._setup_ui()
 
@@ -150,18 +152,7 @@ class SettingsTab(QWidget):
         btn = QPushButton("•")
         btn.setFixedSize(18, 18)
         btn.setToolTip(tooltip)
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: #FFFFFF;
-                border-radius: 9px;
-                font-weight: bold;
-                font-size: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-        """)
+        btn.setStyleSheet(Styles.mini_button(color, hover_color))
         return btn
 
     def _setup_gemini_container(self, lang: dict) -> None:
@@ -172,7 +163,9 @@ class SettingsTab(QWidget):
 
         # API Keys Header
         keys_container = QFrame()
-        keys_container.setStyleSheet("QFrame { background-color: transparent; border-radius: 10px; padding: 0px; }")
+        keys_container.setStyleSheet(
+            "QFrame { background-color: transparent; border-radius: 10px; padding: 0px; }" + _ROWS_QSS
+        )
         keys_main_layout = QVBoxLayout(keys_container)
         keys_main_layout.setContentsMargins(0, 10, 0, 10)
         keys_main_layout.setSpacing(10)
@@ -214,7 +207,7 @@ class SettingsTab(QWidget):
 
         # Models section
         models_container = QFrame()
-        models_container.setStyleSheet("background-color: transparent;")
+        models_container.setStyleSheet("* { background-color: transparent; }" + _ROWS_QSS)
         models_layout = QVBoxLayout(models_container)
         models_layout.setContentsMargins(0, 10, 0, 10)
         models_layout.setSpacing(10)
@@ -243,6 +236,7 @@ class SettingsTab(QWidget):
 
     def _setup_openai_container(self, lang: dict) -> None:
         """Set up OpenAI settings container."""
+        self.openai_container.setStyleSheet(_ROWS_QSS)
         layout = QVBoxLayout(self.openai_container)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(15)
@@ -455,60 +449,10 @@ class SettingsTab(QWidget):
         self.proxy_enabled_changed.emit(checked)
 
     def _update_autostart_style(self, checked: bool) -> None:
-        if checked:
-            self.autostart_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3D8948;
-                    color: white;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 5px;
-                    margin: 0px;
-                    border: none;
-                }
-                QPushButton:hover { background-color: #2A6C34; }
-            """)
-        else:
-            self.autostart_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #676664;
-                    color: #FFFFFF;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 5px;
-                    margin: 0px;
-                    border: none;
-                }
-                QPushButton:hover { background-color: #DDDDDD; color: #000000; }
-            """)
+        self.autostart_btn.setStyleSheet(Styles.switch_button(checked))
 
     def _update_proxy_btn_style(self, checked: bool) -> None:
-        if checked:
-            self.proxy_enable_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #3D8948;
-                    color: white;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 5px;
-                    margin: 0px;
-                    border: none;
-                }
-                QPushButton:hover { background-color: #2A6C34; }
-            """)
-        else:
-            self.proxy_enable_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #676664;
-                    color: #FFFFFF;
-                    border-radius: 9px;
-                    font-weight: bold;
-                    font-size: 5px;
-                    margin: 0px;
-                    border: none;
-                }
-                QPushButton:hover { background-color: #DDDDDD; color: #000000; }
-            """)
+        self.proxy_enable_btn.setStyleSheet(Styles.switch_button(checked))
 
     def _update_proxy_ui_state(self, enabled: bool) -> None:
         self.proxy_type_combo.setEnabled(enabled)
@@ -516,69 +460,86 @@ class SettingsTab(QWidget):
 
     def _update_auto_switch_style(self) -> None:
         """Update auto-switch buttons style."""
-        active = self.config.get("auto_switch_api_keys", False)
-        color = "#5085D0" if active else "#676664"
-        style = f"""
-            QPushButton {{
-                background-color: {color};
-                color: #FFFFFF;
-                border-radius: 9px;
-                font-weight: bold;
-                font-size: 10px;
-            }}
-            QPushButton:hover {{ background-color: #DDDDDD; color: #000000; }}
-        """
-        if hasattr(self, 'gemini_auto_switch_btn'):
-            self.gemini_auto_switch_btn.setStyleSheet(style)
-        if hasattr(self, 'openai_auto_switch_btn'):
-            self.openai_auto_switch_btn.setStyleSheet(style)
+        style = Styles.auto_switch_button(self.config.get("auto_switch_api_keys", False))
+        # Called on every refresh; restyle only when the state flipped
+        for btn in (self.gemini_auto_switch_btn, self.openai_auto_switch_btn):
+            if btn.styleSheet() != style:
+                btn.setStyleSheet(style)
 
     def set_autostart_checked(self, checked: bool) -> None:
         self.autostart_btn.setChecked(checked)
         self._update_autostart_style(checked)
 
-    def _clear_layout(self, layout) -> None:
-        while layout.count():
-            item = layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    @staticmethod
+    def _set_line_text(line_edit: QLineEdit, text: str) -> None:
+        """Replace a row field's text without emitting textChanged."""
+        if line_edit.text() != text:
+            line_edit.blockSignals(True)
+            line_edit.setText(text)
+            line_edit.blockSignals(False)
+
+    @staticmethod
+    def _sync_rows(rows: list, pool: list, layout, radio_group: QButtonGroup,
+                   items: list, create_row, update_row) -> None:
+        """Sync a list of key/model rows with config.
+
+        Existing rows are updated in place (indices shift after a deletion,
+        so row i simply takes item i's values). Surplus rows are hidden into
+        the pool instead of deleted, and new rows come from the pool first.
+        """
+        # The exclusive group cannot uncheck its button directly; clear it
+        # so a row that lost the active state does not keep it
+        checked = radio_group.checkedButton()
+        if checked is not None:
+            radio_group.setExclusive(False)
+            checked.setChecked(False)
+            radio_group.setExclusive(True)
+
+        for refs, item in zip(rows, items):
+            update_row(refs, item)
+
+        # Hidden rows stay in the layout (taking no space) right after the
+        # visible ones, so the pool's top row always sits at index len(rows)
+        # and its index-bound slots need no rewiring
+        while len(rows) > len(items):
+            refs = rows.pop()
+            radio_group.removeButton(refs["radio"])
+            refs["row"].hide()
+            pool.append(refs)
+
+        for i in range(len(rows), len(items)):
+            if pool:
+                refs = pool.pop()
+                radio_group.addButton(refs["radio"], i)
+                update_row(refs, items[i])
+                refs["row"].show()
+            else:
+                refs = create_row(i, items[i])
+                layout.addWidget(refs["row"])
+            rows.append(refs)
 
     def refresh_gemini_keys(self) -> None:
         """Refresh Gemini API keys list."""
-        self._clear_layout(self.gemini_keys_layout)
-
-        for btn in self.gemini_key_radio_group.buttons():
-            self.gemini_key_radio_group.removeButton(btn)
-
-        # Clear button references
-        self.gemini_key_test_buttons.clear()
-
         visible = self.config.get("api_keys_visible", False)
-        keys = self.config.get("api_keys", [])
-
-        for i, key_data in enumerate(keys):
-            row = self._create_key_row(i, key_data, visible, "gemini")
-            self.gemini_keys_layout.addWidget(row)
+        self._sync_rows(
+            self._key_rows["gemini"], self._key_pools["gemini"], self.gemini_keys_layout,
+            self.gemini_key_radio_group, self.config.get("api_keys", []),
+            lambda i, key_data: self._create_key_row(i, key_data, visible, "gemini"),
+            lambda refs, key_data: self._update_key_row(refs, key_data, visible)
+        )
 
     def refresh_openai_keys(self) -> None:
         """Refresh OpenAI API keys list."""
-        self._clear_layout(self.openai_keys_layout)
-
-        for btn in self.openai_key_radio_group.buttons():
-            self.openai_key_radio_group.removeButton(btn)
-
-        # Clear button references
-        self.openai_key_test_buttons.clear()
-
         visible = self.config.get("api_keys_visible", False)
-        keys = self.config.get("openai_api_keys", [])
-
-        for i, key_data in enumerate(keys):
-            row = self._create_key_row(i, key_data, visible, "openai")
-            self.openai_keys_layout.addWidget(row)
-
-    def _create_key_row(self, index: int, key_data: dict, visible: bool, provider: str) -> QWidget:
-        """Create a key row widget."""
+        self._sync_rows(
+            self._key_rows["openai"], self._key_pools["openai"], self.openai_keys_layout,
+            self.openai_key_radio_group, self.config.get("openai_api_keys", []),
+            lambda i, key_data: self._create_key_row(i, key_data, visible, "openai"),
+            lambda refs, key_data: self._update_key_row(refs, key_data, visible)
+        )
+
+    def _create_key_row(self, index: int, key_data: dict, visible: bool, provider: str) -> dict:
+        """Create a key row widget; return it with the widgets refresh updates."""
         row = QWidget()
         layout = QHBoxLayout(row)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -588,18 +549,7 @@ class SettingsTab(QWidget):
         radio = QRadioButton()
         radio.setChecked(key_data.get("active", False))
         radio.setFixedSize(18, 18)
-        radio.setStyleSheet("""
-            QRadioButton { spacing: 0; }
-            QRadioButton::indicator { width: 18px; height: 18px; border-radius: 9px; }
-            QRadioButton::indicator:unchecked { background-color: #353535; }
-            QRadioButton::indicator:unchecked:hover { background-color: #4f4f4f; }
-            QRadioButton::indicator:checked {
-                background-color: qradialgradient(
-                    cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5,
-                    stop:0 #FFFFFF, stop:0.1 #FFFFFF, stop:0.21 #5085D0, stop:1 #5085D0
-                );
-            }
-        """)
+        radio.setObjectName("rowRadio")
 
         if provider == "gemini":
             self.gemini_key_radio_group.addButton(radio, index)
@@ -611,7 +561,7 @@ class SettingsTab(QWidget):
         # Key input
         key_input = QLineEdit(key_data.get("key", ""))
         key_input.setEchoMode(QLineEdit.Normal if visible else QLineEdit.Password)
-        key_input.setStyleSheet("border-radius: 8px; border: 1px solid #444444; padding: 5px; background-color: #2a2a2a; color: #FFFFFF;")
+        key_input.setObjectName("rowInput")
         key_input.textChanged.connect(
             lambda t, i=index: (self.gemini_key_updated if provider == "gemini" else self.openai_key_updated).emit(i, t))
         layout.addWidget(key_input, 1)
@@ -620,7 +570,7 @@ class SettingsTab(QWidget):
         name_input = QLineEdit(key_data.get("name", ""))
         name_input.setPlaceholderText("Имя...")
         name_input.setFixedWidth(80)
-        name_input.setStyleSheet("border-radius: 8px; border: 1px solid #444444; padding: 5px; background-color: #2a2a2a; color: #FFFFFF;")
+        name_input.setObjectName("rowInput")
         layout.addWidget(name_input)
 
         # Test button
@@ -630,12 +580,6 @@ class SettingsTab(QWidget):
             lambda _, i=index: (self.gemini_key_test if provider == "gemini" else self.openai_key_test).emit(i))
         layout.addWidget(test_btn)
 
-        # Store reference to test button for status updates
-        if provider == "gemini":
-            self.gemini_key_test_buttons[index] = test_btn
-        else:
-            self.openai_key_test_buttons[index] = test_btn
-
         # Delete button
         del_btn = self._create_mini_button("#FF5F57", "#FF3B30",
             self.lang.get("tooltips", {}).get("delete_api_key", "Delete key"))
@@ -643,46 +587,44 @@ class SettingsTab(QWidget):
             lambda _, i=index: (self.gemini_key_deleted if provider == "gemini" else self.openai_key_deleted).emit(i))
         layout.addWidget(del_btn)
 
-        return row
+        return {
+            "row": row, "radio": radio, "key_input": key_input,
+            "name_input": name_input, "test_btn": test_btn, "del_btn": del_btn
+        }
+
+    def _update_key_row(self, refs: dict, key_data: dict, visible: bool) -> None:
+        """Show another key's values in an existing row."""
+        if key_data.get("active", False):
+            refs["radio"].setChecked(True)
+        self._set_line_text(refs["key_input"], key_data.get("key", ""))
+        echo_mode = QLineEdit.Normal if visible else QLineEdit.Password
+        if refs["key_input"].echoMode() != echo_mode:
+            refs["key_input"].setEchoMode(echo_mode)
+        self._set_line_text(refs["name_input"], key_data.get("name", ""))
+        self._set_test_button_status(refs["test_btn"], key_data.get("test_status", "not_tested"))
 
     def refresh_gemini_models(self) -> None:
         """Refresh Gemini models list."""
-        self._clear_layout(self.gemini_models_layout)
-
-        for btn in self.gemini_model_radio_group.buttons():
-            self.gemini_model_radio_group.removeButton(btn)
-
-        # Clear label and button references
-        self.gemini_model_time_labels.clear()
-        self.gemini_model_test_buttons.clear()
-
-        models = self.config.get("gemini_models", [])
         active_model = self.config.get("active_model", "")
-
-        for i, model_data in enumerate(models):
-            row = self._create_model_row(i, model_data, active_model, "gemini")
-            self.gemini_models_layout.addWidget(row)
+        self._sync_rows(
+            self._model_rows["gemini"], self._model_pools["gemini"], self.gemini_models_layout,
+            self.gemini_model_radio_group, self.config.get("gemini_models", []),
+            lambda i, model_data: self._create_model_row(i, model_data, active_model, "gemini"),
+            lambda refs, model_data: self._update_model_row(refs, model_data, active_model)
+        )
 
     def refresh_openai_models(self) -> None:
         """Refresh OpenAI models list."""
-        self._clear_layout(self.openai_models_layout)
-
-        for btn in self.openai_model_radio_group.buttons():
-            self.openai_model_radio_group.removeButton(btn)
-
-        # Clear label and button references
-        self.openai_model_time_labels.clear()
-        self.openai_model_test_buttons.clear()
-
-        models = self.config.get("openai_models", [])
         active_model = self.config.get("openai_active_model", "")
-
-        for i, model_data in enumerate(models):
-            row = self._create_model_row(i, model_data, active_model, "openai")
-            self.openai_models_layout.addWidget(row)
-
-    def _create_model_row(self, index: int, model_data: dict, active_model: str, provider: str) -> QWidget:
-        """Create a model row widget."""
+        self._sync_rows(
+            self._model_rows["openai"], self._model_pools["openai"], self.openai_models_layout,
+            self.openai_model_radio_group, self.config.get("openai_models", []),
+            lambda i, model_data: self._create_model_row(i, model_data, active_model, "openai"),
+            lambda refs, model_data: self._update_model_row(refs, model_data, active_model)
+        )
+
+    def _create_model_row(self, index: int, model_data: dict, active_model: str, provider: str) -> dict:
+        """Create a model row widget; return it with the widgets refresh updates."""
         row = QWidget()
         layout = QHBoxLayout(row)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -694,17 +636,7 @@ class SettingsTab(QWidget):
         radio = QRadioButton()
         radio.setChecked(model_name == active_model)
         radio.setFixedSize(18, 18)
-        radio.setStyleSheet("""
-            QRadioButton::indicator { width: 18px; height: 18px; border-radius: 9px; }
-            QRadioButton::indicator:unchecked { background-color: #353535; }
-            QRadioButton::indicator:unchecked:hover { background-color: #4f4f4f; }
-            QRadioButton::indicator:checked {
-                background-color: qradialgradient(
-                    cx:0.5, cy:0.5, radius:0.5, fx:0.5, fy:0.5,
-                    stop:0 #FFFFFF, stop:0.1 #FFFFFF, stop:0.21 #5085D0, stop:1 #5085D0
-                );
-            }
-        """)
+        radio.setObjectName("rowRadio")
 
         if provider == "gemini":
             self.gemini_model_radio_group.addButton(radio, index)
@@ -715,30 +647,19 @@ class SettingsTab(QWidget):
 
         # Name input
         name_input = QLineEdit(model_name)
-        name_input.setStyleSheet("border-radius: 8px; border: 1px solid #444444; padding: 5px; background-color: #2a2a2a; color: #FFFFFF;")
+        name_input.setObjectName("rowInput")
         name_input.textChanged.connect(
             lambda t, i=index: (self.gemini_model_updated if provider == "gemini" else self.openai_model_updated).emit(i, t))
         layout.addWidget(name_input, 1)
 
         # Test time label
-        test_time = model_data.get("test_duration", 0.0)
         status = model_data.get("test_status", "not_tested")
-        time_text = f"{test_time:.1f}s" if test_time > 0 else "0.0s"
-        if status == "error":
-            time_text = "err"
-
-        time_label = QLabel(time_text)
-        time_label.setStyleSheet("color: #888888; font-size: 12px;")
+        time_label = QLabel(self._model_time_text(model_data))
+        time_label.setObjectName("rowTime")
         time_label.setFixedWidth(50)
         time_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(time_label)
 
-        # Store reference to time label for live updates
-        if provider == "gemini":
-            self.gemini_model_time_labels[index] = time_label
-        else:
-            self.openai_model_time_labels[index] = time_label
-
         # Test button
         test_btn = self._create_test_button(status)
         test_btn.setToolTip(self.lang.get("tooltips", {}).get("test_model", "Test model"))
@@ -746,12 +667,6 @@ class SettingsTab(QWidget):
             lambda _, i=index: (self.gemini_model_test if provider == "gemini" else self.openai_model_test).emit(i))
         layout.addWidget(test_btn)
 
-        # Store reference to test button for status updates
-        if provider == "gemini":
-            self.gemini_model_test_buttons[index] = test_btn
-        else:
-            self.openai_model_test_buttons[index] = test_btn
-
         # Delete button
         del_btn = self._create_mini_button("#FF5F57", "#FF3B30",
             self.lang.get("tooltips", {}).get("delete_model", "Delete model"))
@@ -759,38 +674,57 @@ class SettingsTab(QWidget):
             lambda _, i=index: (self.gemini_model_deleted if provider == "gemini" else self.openai_model_deleted).emit(i))
         layout.addWidget(del_btn)
 
-        return row
+        return {
+            "row": row, "radio": radio, "name_input": name_input,
+            "time_label": time_label, "test_btn": test_btn, "del_btn": del_btn
+        }
+
+    def _update_model_row(self, refs: dict, model_data: dict, active_model: str) -> None:
+        """Show another model's values in an existing row."""
+        model_name = model_data.get("name", "")
+        if model_name == active_model:
+            refs["radio"].setChecked(True)
+        self._set_line_text(refs["name_input"], model_name)
+        time_text = self._model_time_text(model_data)
+        if refs["time_label"].text() != time_text:
+            refs["time_label"].setText(time_text)
+        self._set_test_button_status(refs["test_btn"], model_data.get("test_status", "not_tested"))
+
+    @staticmethod
+    def _model_time_text(model_data: dict) -> str:
+        """Text of a model's test time label."""
+        if model_data.get("test_status", "not_tested") == "error":
+            return "err"
+        test_time = model_data.get("test_duration", 0.0)
+        return f"{test_time:.1f}s" if test_time > 0 else "0.0s"
 
     def _create_test_button(self, status: str) -> QPushButton:
         """Create a test status button."""
         btn = QPushButton("•")
         btn.setFixedSize(18, 18)
-
-        colors = {
-            "success": ("#28A745", "#218838"),
-            "error": ("#DC3545", "#C82333"),
-            "testing": ("#FFC107", "#E0A800"),
-            "not_tested": ("#6c757d", "#5a6268")
-        }
-        color, hover = colors.get(status, ("#6c757d", "#5a6268"))
-
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                color: white;
-                border-radius: 9px;
-            }}
-            QPushButton:hover {{ background-color: {hover}; }}
-        """)
+        self._set_test_button_status(btn, status)
         return btn
 
+    @staticmethod
+    def _set_test_button_status(btn: QPushButton, status: str) -> None:
+        """Color a test button by status; restyle only when the status changes."""
+        if btn.property("status") == status:
+            return
+        btn.setProperty("status", status)
+        btn.setStyleSheet(Styles.test_button(status))
+
     def refresh_all(self) -> None:
         """Refresh all lists."""
-        self.refresh_gemini_keys()
-        self.refresh_gemini_models()
-        self.refresh_openai_keys()
-        self.refresh_openai_models()
-        self._update_auto_switch_style()
+        # Repaint once after all rows are updated, not after each one
+        self.setUpdatesEnabled(False)
+        try:
+            self.refresh_gemini_keys()
+            self.refresh_gemini_models()
+            self.refresh_openai_keys()
+            self.refresh_openai_models()
+            self._update_auto_switch_style()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def set_test_status(self, provider: str, item_type: str, index: int, status: str) -> None:
         """Set test status for a key or model."""
@@ -805,9 +739,9 @@ class SettingsTab(QWidget):
             index: Model index
             text: Text to display (e.g., "0.3s")
         """
-        labels = self.gemini_model_time_labels if provider == "gemini" else self.openai_model_time_labels
-        if index in labels:
-            labels[index].setText(text)
+        rows = self._model_rows[provider]
+        if 0 <= index < len(rows):
+            rows[index]["time_label"].setText(text)
 
     def update_test_button_status(self, provider: str, item_type: str, index: int, status: str) -> None:
         """Update the test button style for a key or model.
@@ -818,28 +752,9 @@ class SettingsTab(QWidget):
             index: Item index
             status: "not_tested", "testing", "success", "error"
         """
-        if item_type == "key":
-            buttons = self.gemini_key_test_buttons if provider == "gemini" else self.openai_key_test_buttons
-        else:
-            buttons = self.gemini_model_test_buttons if provider == "gemini" else self.openai_model_test_buttons
-
-        if index in buttons:
-            btn = buttons[index]
-            colors = {
-                "success": ("#28A745", "#218838"),
-                "error": ("#DC3545", "#C82333"),
-                "testing": ("#FFC107", "#E0A800"),
-                "not_tested": ("#6c757d", "#5a6268")
-            }
-            color, hover = colors.get(status, ("#6c757d", "#5a6268"))
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {color};
-                    color: white;
-                    border-radius: 9px;
-                }}
-                QPushButton:hover {{ background-color: {hover}; }}
-            """)
+        rows = (self._key_rows if item_type == "key" else self._model_rows)[provider]
+        if 0 <= index < len(rows):
+            self._set_test_button_status(rows[index]["test_btn"], status)
 
     def update_language(self, lang: dict) -> None:
         """Update UI text with new language.
@@ -864,3 +779,15 @@ class SettingsTab(QWidget):
 
         # Update zoom label
         self.zoom_label.setText(settings_lang.get("zoom_label", "Zoom:"))
+
+        # Row tooltips (rows are reused, not rebuilt; pooled rows included)
+        tooltips = lang.get("tooltips", {})
+        delete_key = tooltips.get("delete_api_key", "Delete key")
+        delete_model = tooltips.get("delete_model", "Delete model")
+        test_model = tooltips.get("test_model", "Test model")
+        for provider in ("gemini", "openai"):
+            for refs in self._key_rows[provider] + self._key_pools[provider]:
+                refs["del_btn"].setToolTip(delete_key)
+            for refs in self._model_rows[provider] + self._model_pools[provider]:
+                refs["del_btn"].setToolTip(delete_model)
+                refs["test_btn"].setToolTip(test_model)
@@ -1,15 +1,28 @@
 """Update checker - checks GitHub releases for new versions."""
 
 import json
-import threading
+import os
 import urllib.request
 from typing import Callable, Optional
 
+from PyQt5.QtCore import QObject, QUrl
+from PyQt5.QtNetwork import (
+    QNetworkAccessManager, QNetworkProxy, QNetworkProxyFactory, QNetworkProxyQuery,
+    QNetworkReply, QNetworkRequest
+)
 
-class UpdateChecker(threading.Thread):
-    """Background thread to check for updates on GitHub."""
+
+class UpdateChecker(QObject):
+    """Asynchronous check for updates on GitHub.
+
+    The request runs on Qt's network stack and the callbacks are invoked
+    on the thread that owns the checker (the GUI thread), so no Python
+    thread is needed. They run inside the reply slot, so callers that open
+    a modal dialog should defer it (e.g. through a queued signal).
+    """
 
     GITHUB_API_URL = "https://api.github.com/repos/Veta-one/ClipGen/releases/latest"
+    TIMEOUT_MS = 5000
 
     def __init__(
         self,
@@ -17,7 +30,8 @@ class UpdateChecker(threading.Thread):
         skipped_version: str,
         found_callback: Callable[[str, str, str], None],
         not_found_callback: Callable[[], None],
-        is_manual: bool = False
+        is_manual: bool = False,
+        parent: Optional[QObject] = None
     ):
         """Initialize update checker.
 
@@ -27,20 +41,60 @@ class UpdateChecker(threading.Thread):
             found_callback: Called with (version, url, release_notes) when update found
             not_found_callback: Called when no update or on manual check with no update
             is_manual: True if user manually triggered the check
+            parent: Owner keeping the checker alive until the reply arrives
         """
-        super().__init__()
+        super().__init__(parent)
         self.current_version = current_version
         self.skipped_version = skipped_version
         self.found_callback = found_callback
         self.not_found_callback = not_found_callback
         self.is_manual = is_manual
-        self.daemon = True
+        self._nam = QNetworkAccessManager(self)
+        self._reply: Optional[QNetworkReply] = None
+
+    def start(self) -> None:
+        """Send the release request; the result is handled in _on_reply."""
+        url = QUrl(self.GITHUB_API_URL)
+        # Set on this checker's manager only; no process-wide proxy state
+        self._nam.setProxy(self._proxy_for(url))
+        request = QNetworkRequest(url)
+        request.setTransferTimeout(self.TIMEOUT_MS)
+        self._reply = self._nam.get(request)
+        self._reply.finished.connect(self._on_reply)
+
+    @staticmethod
+    def _proxy_for(url: QUrl) -> QNetworkProxy:
+        """Pick the proxy for a request the way urllib did.
 
-    def run(self) -> None:
-        """Check for updates."""
+        The variables set by utils.proxy.apply_proxy win (honoring NO_PROXY);
+        without them the system proxy (registry/PAC) is used.
+        """
+        proxy_url = os.environ.get("HTTPS_PROXY") or os.environ.get("HTTP_PROXY")
+        if not proxy_url:
+            proxies = QNetworkProxyFactory.systemProxyForQuery(QNetworkProxyQuery(url))
+            return proxies[0] if proxies else QNetworkProxy(QNetworkProxy.NoProxy)
+        if urllib.request.proxy_bypass_environment(url.host()):
+            return QNetworkProxy(QNetworkProxy.NoProxy)
+
+        url = QUrl(proxy_url)
+        if url.scheme() == "socks5":
+            proxy_type, default_port = QNetworkProxy.Socks5Proxy, 1080
+        else:
+            proxy_type, default_port = QNetworkProxy.HttpProxy, 8080
+        return QNetworkProxy(
+            proxy_type, url.host(), url.port(default_port),
+            url.userName(), url.password()
+        )
+
+    def _on_reply(self) -> None:
+        """Parse the GitHub response and dispatch callbacks."""
+        reply = self._reply
+        self._reply = None
         try:
-            with urllib.request.urlopen(self.GITHUB_API_URL, timeout=5) as response:
-                data = json.loads(response.read().decode())
+            if reply.error() != QNetworkReply.NoError:
+                raise RuntimeError(reply.errorString())
+
+            data = json.loads(bytes(reply.readAll()).decode())
 
             latest_tag = data.get("tag_name", "").replace("v", "")
             html_url = data.get("html_url", "")
@@ -58,6 +112,8 @@ class UpdateChecker(threading.Thread):
             print(f"Update check failed: {e}")
             if self.is_manual:
                 self.not_found_callback()
+        finally:
+            reply.deleteLater()
 
     def _is_newer_version(self, latest: str) -> bool:
         """Compare version strings."""